@@ -0,0 +1,156 @@
+"""Initial schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-15 22:58:13.608576
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.types import UUID
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.create_table('users',
+    sa.Column('id', UUID(), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('hashed_password', sa.String(length=255), nullable=False),
+    sa.Column('full_name', sa.String(length=255), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('is_verified', sa.Boolean(), nullable=False),
+    sa.Column('is_superuser', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('last_login', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_table('notifications',
+    sa.Column('id', UUID(), nullable=False),
+    sa.Column('user_id', UUID(), nullable=False),
+    sa.Column('type', sa.String(length=50), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('message', sa.Text(), nullable=True),
+    sa.Column('is_read', sa.Boolean(), nullable=False),
+    sa.Column('meta_data', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('read_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_notifications_created_at'), 'notifications', ['created_at'], unique=False)
+    op.create_index(op.f('ix_notifications_id'), 'notifications', ['id'], unique=False)
+    op.create_index(op.f('ix_notifications_is_read'), 'notifications', ['is_read'], unique=False)
+    op.create_index(op.f('ix_notifications_user_id'), 'notifications', ['user_id'], unique=False)
+    op.create_index('ix_notifications_user_id_id', 'notifications', ['user_id', 'id'], unique=False)
+    op.create_index('ix_notifications_user_unread', 'notifications', ['user_id', 'created_at'], unique=False, postgresql_where=sa.text('is_read = false'), sqlite_where=sa.text('is_read = 0'))
+    op.create_table('projects',
+    sa.Column('id', UUID(), nullable=False),
+    sa.Column('user_id', UUID(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_projects_id'), 'projects', ['id'], unique=False)
+    op.create_index(op.f('ix_projects_user_id'), 'projects', ['user_id'], unique=False)
+    op.create_index('ix_projects_user_id_id', 'projects', ['user_id', 'id'], unique=False)
+    op.create_table('feedbacks',
+    sa.Column('id', UUID(), nullable=False),
+    sa.Column('user_id', UUID(), nullable=False),
+    sa.Column('project_id', UUID(), nullable=False),
+    sa.Column('raw_text', sa.Text(), nullable=False),
+    sa.Column('summary', sa.JSON(), nullable=True),
+    sa.Column('sentiment', sa.String(length=50), nullable=True),
+    sa.Column('priority', sa.String(length=50), nullable=True),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('batch_id', sa.String(length=100), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_feedbacks_batch_id'), 'feedbacks', ['batch_id'], unique=False)
+    op.create_index(op.f('ix_feedbacks_created_at'), 'feedbacks', ['created_at'], unique=False)
+    op.create_index(op.f('ix_feedbacks_id'), 'feedbacks', ['id'], unique=False)
+    op.create_index(op.f('ix_feedbacks_project_id'), 'feedbacks', ['project_id'], unique=False)
+    op.create_index('ix_feedbacks_project_id_user_id', 'feedbacks', ['project_id', 'user_id'], unique=False)
+    op.create_index(op.f('ix_feedbacks_user_id'), 'feedbacks', ['user_id'], unique=False)
+    op.create_index('ix_feedbacks_user_id_id', 'feedbacks', ['user_id', 'id'], unique=False)
+    op.create_table('action_items',
+    sa.Column('id', UUID(), nullable=False),
+    sa.Column('feedback_id', UUID(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('is_completed', sa.Boolean(), nullable=False),
+    sa.Column('priority', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['feedback_id'], ['feedbacks.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_action_items_feedback_id'), 'action_items', ['feedback_id'], unique=False)
+    op.create_index(op.f('ix_action_items_id'), 'action_items', ['id'], unique=False)
+    op.create_table('revisions',
+    sa.Column('id', UUID(), nullable=False),
+    sa.Column('feedback_id', UUID(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('file_url', sa.String(length=500), nullable=True),
+    sa.Column('file_name', sa.String(length=255), nullable=True),
+    sa.Column('file_size', sa.BigInteger(), nullable=True),
+    sa.Column('file_type', sa.String(length=100), nullable=True),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('approved_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['feedback_id'], ['feedbacks.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_revisions_created_at'), 'revisions', ['created_at'], unique=False)
+    op.create_index(op.f('ix_revisions_feedback_id'), 'revisions', ['feedback_id'], unique=False)
+    op.create_index('ix_revisions_feedback_id_version', 'revisions', ['feedback_id', 'version'], unique=True)
+    op.create_index(op.f('ix_revisions_id'), 'revisions', ['id'], unique=False)
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_revisions_id'), table_name='revisions')
+    op.drop_index('ix_revisions_feedback_id_version', table_name='revisions')
+    op.drop_index(op.f('ix_revisions_feedback_id'), table_name='revisions')
+    op.drop_index(op.f('ix_revisions_created_at'), table_name='revisions')
+    op.drop_table('revisions')
+    op.drop_index(op.f('ix_action_items_id'), table_name='action_items')
+    op.drop_index(op.f('ix_action_items_feedback_id'), table_name='action_items')
+    op.drop_table('action_items')
+    op.drop_index('ix_feedbacks_user_id_id', table_name='feedbacks')
+    op.drop_index(op.f('ix_feedbacks_user_id'), table_name='feedbacks')
+    op.drop_index('ix_feedbacks_project_id_user_id', table_name='feedbacks')
+    op.drop_index(op.f('ix_feedbacks_project_id'), table_name='feedbacks')
+    op.drop_index(op.f('ix_feedbacks_id'), table_name='feedbacks')
+    op.drop_index(op.f('ix_feedbacks_created_at'), table_name='feedbacks')
+    op.drop_index(op.f('ix_feedbacks_batch_id'), table_name='feedbacks')
+    op.drop_table('feedbacks')
+    op.drop_index('ix_projects_user_id_id', table_name='projects')
+    op.drop_index(op.f('ix_projects_user_id'), table_name='projects')
+    op.drop_index(op.f('ix_projects_id'), table_name='projects')
+    op.drop_table('projects')
+    op.drop_index('ix_notifications_user_unread', table_name='notifications', postgresql_where=sa.text('is_read = false'), sqlite_where=sa.text('is_read = 0'))
+    op.drop_index('ix_notifications_user_id_id', table_name='notifications')
+    op.drop_index(op.f('ix_notifications_user_id'), table_name='notifications')
+    op.drop_index(op.f('ix_notifications_is_read'), table_name='notifications')
+    op.drop_index(op.f('ix_notifications_id'), table_name='notifications')
+    op.drop_index(op.f('ix_notifications_created_at'), table_name='notifications')
+    op.drop_table('notifications')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
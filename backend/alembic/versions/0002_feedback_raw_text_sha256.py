@@ -0,0 +1,46 @@
+"""Add feedback raw_text_sha256 and dedup constraint
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 23:10:00.000000
+
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.add_column('feedbacks', sa.Column('raw_text_sha256', sa.String(length=64), nullable=True))
+    
+    # Backfill in Python so the digest matches the model's before_insert hook on every backend
+    feedbacks = sa.table(
+        'feedbacks',
+        sa.column('id'),
+        sa.column('raw_text', sa.Text()),
+        sa.column('raw_text_sha256', sa.String(length=64)),
+    )
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(feedbacks.c.id, feedbacks.c.raw_text)).fetchall()
+    for row in rows:
+        connection.execute(
+            feedbacks.update().where(feedbacks.c.id == row.id).values(
+                raw_text_sha256=hashlib.sha256(row.raw_text.encode('utf-8')).hexdigest()
+            )
+        )
+    
+    # Existing duplicates of (user_id, project_id, raw_text) must be merged before this step
+    with op.batch_alter_table('feedbacks') as batch_op:
+        batch_op.alter_column('raw_text_sha256', existing_type=sa.String(length=64), nullable=False)
+        batch_op.create_unique_constraint('uq_feedback_dedup', ['user_id', 'project_id', 'raw_text_sha256'])
+
+def downgrade() -> None:
+    with op.batch_alter_table('feedbacks') as batch_op:
+        batch_op.drop_constraint('uq_feedback_dedup', type_='unique')
+        batch_op.drop_column('raw_text_sha256')
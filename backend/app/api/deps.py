@@ -2,46 +2,60 @@
 API Dependencies
 FastAPI dependency injection for auth, database, etc.
 """
-from typing import Generator, Optional
-from fastapi import Depends, HTTPException, status
+from typing import AsyncGenerator, Optional
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.core.config import settings
-from app.core.security import decode_token, verify_token_type
-from app.db.session import SessionLocal
+from app.core.security import get_access_token_subject
+from app.db.session import AsyncSessionLocal
 from app.models.user import User
 
 security = HTTPBearer()
 
-def get_db() -> Generator:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Database session dependency"""
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
-def get_current_user(
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> User:
-    """Get current authenticated user"""
-    token = credentials.credentials
+def _get_token_user_id(request: Request, token: str) -> UUID:
+    """Resolve the user id of an access token, reusing the middleware's decode"""
+    if hasattr(request.state, "user_id"):
+        user_id = request.state.user_id
+    else:
+        try:
+            user_id = get_access_token_subject(token)
+        except ValueError:
+            user_id = None
     
-    try:
-        payload = decode_token(token)
-        verify_token_type(payload, "access")
-        user_id: UUID = UUID(payload.get("sub"))
-    except (JWTError, ValueError):
+    if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
+    return user_id
+
+async def get_current_user_id(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> UUID:
+    """Get the authenticated user's id from the token, without loading the user"""
+    return _get_token_user_id(request, credentials.credentials)
+
+async def get_current_user(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> User:
+    """Get current authenticated user"""
+    user_id = _get_token_user_id(request, credentials.credentials)
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = (await db.execute(
+        select(User).where(User.id == user_id)
+    )).scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -56,7 +70,7 @@ def get_current_user(
     
     return user
 
-def get_current_active_user(
+async def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
     """Get current active user"""
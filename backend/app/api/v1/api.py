@@ -3,7 +3,7 @@ API Router
 Aggregates all API endpoints
 """
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, users, projects, feedback, revisions, notifications
+from app.api.v1.endpoints import auth, users, projects, feedback, revisions, notifications, batch
 
 api_router = APIRouter()
 
@@ -13,3 +13,4 @@ api_router.include_router(projects.router, prefix="/projects", tags=["Projects"]
 api_router.include_router(feedback.router, prefix="/feedback", tags=["Feedback"])
 api_router.include_router(revisions.router, prefix="/revisions", tags=["Revisions"])
 api_router.include_router(notifications.router, prefix="/notifications", tags=["Notifications"])
+api_router.include_router(batch.router, prefix="/batch", tags=["Batch"])
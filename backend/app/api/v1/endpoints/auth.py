@@ -4,12 +4,22 @@ User registration, login, token refresh
 """
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Dict, Optional
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Cookie, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, get_current_user
+from app.core.config import settings
+from app.core.rate_limit import (
+    LOGIN_RATE_LIMIT,
+    REGISTER_RATE_LIMIT,
+    auth_rate_limit_key,
+    limiter,
+)
 from app.core.security import (
     verify_password,
     get_password_hash,
@@ -23,17 +33,40 @@ from app.schemas.user import UserCreate, UserResponse
 
 router = APIRouter()
 
+# The refresh token also travels as an httpOnly cookie scoped to the auth
+# routes, so browsers never need to keep it where scripts can read it
+REFRESH_COOKIE_NAME = "refresh_token"
+REFRESH_COOKIE_PATH = f"{settings.API_V1_PREFIX}/auth"
+
+
+def set_refresh_cookie(response: Response, tokens: Dict[str, str]) -> None:
+    """Attach the refresh token to the response as an httpOnly cookie"""
+    response.set_cookie(
+        REFRESH_COOKIE_NAME,
+        tokens["refresh_token"],
+        max_age=settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
+        path=REFRESH_COOKIE_PATH,
+        httponly=True,
+        secure=settings.is_production,
+        samesite="strict",
+    )
+
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register(
+@limiter.limit(REGISTER_RATE_LIMIT)
+async def register(
+    request: Request,
+    response: Response,
     user_in: UserCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
     Register a new user
     """
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_in.email).first()
+    existing_user = (await db.execute(
+        select(User).where(User.email == user_in.email)
+    )).scalar_one_or_none()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -44,30 +77,35 @@ def register(
     user = User(
         email=user_in.email,
         full_name=user_in.full_name,
-        hashed_password=get_password_hash(user_in.password),
+        hashed_password=await run_in_threadpool(get_password_hash, user_in.password),
         is_active=True,
         is_verified=False,
     )
     
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
     
     return user
 
 
 @router.post("/login", response_model=Token)
-def login(
+@limiter.limit(LOGIN_RATE_LIMIT, key_func=auth_rate_limit_key)
+async def login(
+    request: Request,
     login_data: LoginRequest,
-    db: Session = Depends(get_db)
+    response: Response,
+    db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
     User login - returns JWT tokens
     """
     # Find user by email
-    user = db.query(User).filter(User.email == login_data.email).first()
+    user = (await db.execute(
+        select(User).where(User.email == login_data.email)
+    )).scalar_one_or_none()
     
-    if not user or not verify_password(login_data.password, user.hashed_password):
+    # bcrypt is CPU-bound; keep it off the event loop
+    if not user or not await run_in_threadpool(verify_password, login_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -82,26 +120,31 @@ def login(
     
     # Update last login
     user.last_login = datetime.utcnow()
-    db.commit()
+    await db.commit()
     
     # Create token pair
     tokens = create_token_pair(str(user.id), user.email)
+    set_refresh_cookie(response, tokens)
     
     return tokens
 
 
 @router.post("/refresh", response_model=Token)
-def refresh_token(
-    refresh_data: RefreshTokenRequest,
-    db: Session = Depends(get_db)
+async def refresh_token(
+    response: Response,
+    refresh_data: Optional[RefreshTokenRequest] = None,
+    refresh_cookie: Optional[str] = Cookie(None, alias=REFRESH_COOKIE_NAME),
+    db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
     Refresh access token using refresh token
+    Accepts the token in the request body or the refresh cookie
     """
+    token = refresh_data.refresh_token if refresh_data else refresh_cookie
     try:
-        payload = decode_token(refresh_data.refresh_token)
+        payload = decode_token(token)
         verify_token_type(payload, "refresh")
-        user_id = payload.get("sub")
+        user_id = UUID(payload.get("sub"))
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -110,21 +153,24 @@ def refresh_token(
         )
     
     # Verify user exists and is active
-    user = db.query(User).filter(User.id == user_id).first()
+    user = (await db.execute(
+        select(User).where(User.id == user_id)
+    )).scalar_one_or_none()
     if not user or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive"
         )
     
-    # Create new token pair
+    # Create new token pair, rotating the refresh cookie
     tokens = create_token_pair(str(user.id), user.email)
+    set_refresh_cookie(response, tokens)
     
     return tokens
 
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(
+async def get_current_user_info(
     current_user: User = Depends(get_current_user)
 ) -> Any:
     """
@@ -134,10 +180,11 @@ def get_current_user_info(
 
 
 @router.post("/logout")
-def logout(
-    current_user: User = Depends(get_current_user)
+async def logout(
+    response: Response
 ) -> Any:
     """
-    Logout user (client should discard tokens)
+    Logout user (clears the refresh cookie; client should discard its access token)
     """
+    response.delete_cookie(REFRESH_COOKIE_NAME, path=REFRESH_COOKIE_PATH)
     return {"message": "Successfully logged out"}
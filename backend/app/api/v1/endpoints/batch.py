@@ -0,0 +1,130 @@
+"""
+Batch Request Endpoint
+Runs a chain of API calls in one round trip, resolving ${id.field}
+references to the results of earlier operations
+"""
+import posixpath
+import re
+from typing import Any, Dict, List
+from urllib.parse import unquote, urlsplit
+from fastapi import APIRouter, HTTPException, Request, status
+import httpx
+
+from app.core.config import settings
+from app.core.rate_limit import client_ip
+from app.schemas.batch import BatchOperation, BatchResult
+
+router = APIRouter()
+
+MAX_BATCH_OPERATIONS = 20
+REFERENCE_PATTERN = re.compile(r"\$\{(\w+)\.(\w+)\}")
+
+def _resolve(value: Any, results: Dict[str, Any]) -> Any:
+    """Substitute ${id.field} references with values from earlier results"""
+    if isinstance(value, dict):
+        return {key: _resolve(item, results) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_resolve(item, results) for item in value]
+    if not isinstance(value, str):
+        return value
+
+    def lookup(match: re.Match) -> Any:
+        op_id, field = match.groups()
+        body = results.get(op_id)
+        if not isinstance(body, dict) or field not in body:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unresolvable reference: {match.group(0)}"
+            )
+        return body[field]
+
+    # A value that is exactly one reference keeps the referenced type
+    full = REFERENCE_PATTERN.fullmatch(value)
+    if full:
+        return lookup(full)
+    return REFERENCE_PATTERN.sub(lambda m: str(lookup(m)), value)
+
+def _targets_batch(path: str) -> bool:
+    """Whether path resolves to this endpoint once dot segments and escapes are applied"""
+    resolved = posixpath.normpath(unquote(urlsplit(path).path))
+    return resolved.strip("/").split("/")[0] == "batch"
+
+def _mark_in_batch(app: Any) -> Any:
+    """Wrap app so every sub-request carries an in-batch flag in its scope state"""
+    async def marked(scope, receive, send):
+        scope.setdefault("state", {})["in_batch"] = True
+        await app(scope, receive, send)
+    return marked
+
+def _response_body(response: httpx.Response) -> Any:
+    """JSON body decoded, any other body as text, None if empty"""
+    if not response.content:
+        return None
+    if response.headers.get("content-type", "").startswith("application/json"):
+        try:
+            return response.json()
+        except ValueError:
+            pass
+    return response.text
+
+@router.post("", response_model=List[BatchResult])
+async def run_batch(
+    operations: List[BatchOperation],
+    request: Request
+) -> Any:
+    """Execute operations in order, stopping at the first failure"""
+    if getattr(request.state, "in_batch", False):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batches cannot be nested"
+        )
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch may contain at most {MAX_BATCH_OPERATIONS} operations"
+        )
+    if len({op.id for op in operations}) != len(operations):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Operation ids must be unique"
+        )
+    if any(_targets_batch(op.path) for op in operations):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batches cannot be nested"
+        )
+
+    # Sub-requests are dispatched in-process through the app itself, so they
+    # go through the same validation, auth and middleware as direct calls
+    headers = {}
+    if "authorization" in request.headers:
+        headers["Authorization"] = request.headers["authorization"]
+    base_url = str(request.base_url).rstrip("/") + settings.API_V1_PREFIX
+
+    results: Dict[str, Any] = {}
+    responses: List[BatchResult] = []
+    failed = False
+
+    async with httpx.AsyncClient(
+        # Sub-requests appear to come from the original client, so per-IP
+        # rate limits (e.g. on /auth) still apply per caller
+        transport=httpx.ASGITransport(app=_mark_in_batch(request.app), client=(client_ip(request), 0)),
+        headers=headers,
+    ) as client:
+        for op in operations:
+            if failed:
+                responses.append(BatchResult(id=op.id, status=status.HTTP_424_FAILED_DEPENDENCY))
+                continue
+
+            response = await client.request(
+                op.method,
+                base_url + op.path,
+                json=_resolve(op.body, results) if op.body is not None else None,
+                params=_resolve(op.params, results),
+            )
+            body = _response_body(response)
+            results[op.id] = body
+            responses.append(BatchResult(id=op.id, status=response.status_code, body=body))
+            failed = response.status_code >= 400
+
+    return responses
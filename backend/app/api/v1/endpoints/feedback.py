@@ -2,13 +2,16 @@
 Feedback Management Endpoints
 """
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status, BackgroundTasks
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from uuid import UUID
 
-from app.api.deps import get_db, get_current_user
-from app.models.user import User
-from app.models.feedback import Feedback
+from app.api.deps import get_db, get_current_user_id
+from app.models.feedback import Feedback, raw_text_digest
 from app.models.project import Project
 from app.models.action_item import ActionItem
 from app.models.revision import Revision
@@ -19,18 +22,21 @@ from app.schemas.revision import RevisionResponse
 router = APIRouter()
 
 @router.post("/", response_model=FeedbackResponse, status_code=status.HTTP_201_CREATED)
-def create_feedback(
+async def create_feedback(
     feedback_in: FeedbackCreate,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """Submit new feedback for AI parsing"""
     # Verify project exists and belongs to user
-    project = db.query(Project).filter(
-        Project.id == feedback_in.project_id,
-        Project.user_id == current_user.id
-    ).first()
+    project = (await db.execute(
+        select(Project).where(
+            Project.id == feedback_in.project_id,
+            Project.user_id == user_id
+        )
+    )).scalar_one_or_none()
     
     if not project:
         raise HTTPException(
@@ -39,14 +45,26 @@ def create_feedback(
         )
     
     # Create feedback
-    feedback = Feedback(
-        **feedback_in.model_dump(),
-        user_id=current_user.id,
+    feedback = Feedback.from_schema(
+        feedback_in,
+        user_id=user_id,
         status="pending"
     )
     db.add(feedback)
-    db.commit()
-    db.refresh(feedback)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # Same text already submitted to this project: return the stored row
+        await db.rollback()
+        feedback = (await db.execute(
+            select(Feedback).where(
+                Feedback.user_id == user_id,
+                Feedback.project_id == feedback_in.project_id,
+                Feedback.raw_text_sha256 == raw_text_digest(feedback_in.raw_text)
+            )
+        )).scalar_one()
+        response.status_code = status.HTTP_200_OK
+        return feedback
     
     # Queue AI parsing task
     # background_tasks.add_task(parse_feedback_task, feedback.id)
@@ -54,16 +72,18 @@ def create_feedback(
     return feedback
 
 @router.get("/{feedback_id}", response_model=FeedbackResponse)
-def get_feedback(
+async def get_feedback(
     feedback_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """Get feedback by ID"""
-    feedback = db.query(Feedback).filter(
-        Feedback.id == feedback_id,
-        Feedback.user_id == current_user.id
-    ).first()
+    feedback = (await db.execute(
+        select(Feedback).where(
+            Feedback.id == feedback_id,
+            Feedback.user_id == user_id
+        )
+    )).scalar_one_or_none()
     
     if not feedback:
         raise HTTPException(
@@ -72,33 +92,37 @@ def get_feedback(
         )
     return feedback
 
-@router.get("/project/{project_id}", response_model=List[FeedbackResponse])
-def list_project_feedback(
+@router.get("/project/{project_id}", responses={200: {"model": List[FeedbackResponse]}})
+async def list_project_feedback(
     project_id: UUID,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """List all feedback for a project"""
-    feedbacks = db.query(Feedback).filter(
-        Feedback.project_id == project_id,
-        Feedback.user_id == current_user.id
-    ).offset(skip).limit(limit).all()
-    return feedbacks
+    feedbacks = (await db.execute(
+        select(Feedback).where(
+            Feedback.project_id == project_id,
+            Feedback.user_id == user_id
+        ).offset(skip).limit(limit)
+    )).scalars().all()
+    return ORJSONResponse(content=[feedback.to_dict() for feedback in feedbacks])
 
 @router.put("/{feedback_id}", response_model=FeedbackResponse)
-def update_feedback(
+async def update_feedback(
     feedback_id: UUID,
     feedback_update: FeedbackUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """Update feedback"""
-    feedback = db.query(Feedback).filter(
-        Feedback.id == feedback_id,
-        Feedback.user_id == current_user.id
-    ).first()
+    feedback = (await db.execute(
+        select(Feedback).where(
+            Feedback.id == feedback_id,
+            Feedback.user_id == user_id
+        )
+    )).scalar_one_or_none()
     
     if not feedback:
         raise HTTPException(
@@ -110,21 +134,32 @@ def update_feedback(
     for field, value in update_data.items():
         setattr(feedback, field, value)
     
-    db.commit()
-    db.refresh(feedback)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Identical feedback already exists in this project"
+        )
     return feedback
 
 @router.delete("/{feedback_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_feedback(
+async def delete_feedback(
     feedback_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> None:
     """Delete feedback"""
-    feedback = db.query(Feedback).filter(
-        Feedback.id == feedback_id,
-        Feedback.user_id == current_user.id
-    ).first()
+    feedback = (await db.execute(
+        select(Feedback).where(
+            Feedback.id == feedback_id,
+            Feedback.user_id == user_id
+        ).options(
+            selectinload(Feedback.revisions),
+            selectinload(Feedback.action_items)
+        )
+    )).scalar_one_or_none()
     
     if not feedback:
         raise HTTPException(
@@ -132,23 +167,25 @@ def delete_feedback(
             detail="Feedback not found"
         )
     
-    db.delete(feedback)
-    db.commit()
+    await db.delete(feedback)
+    await db.commit()
 
-@router.get("/{feedback_id}/actions", response_model=List[ActionItemResponse])
-def list_action_items(
+@router.get("/{feedback_id}/actions", responses={200: {"model": List[ActionItemResponse]}})
+async def list_action_items(
     feedback_id: UUID,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """List all action items for a feedback"""
     # Verify feedback exists and belongs to user
-    feedback = db.query(Feedback).filter(
-        Feedback.id == feedback_id,
-        Feedback.user_id == current_user.id
-    ).first()
+    feedback = (await db.execute(
+        select(Feedback).where(
+            Feedback.id == feedback_id,
+            Feedback.user_id == user_id
+        )
+    )).scalar_one_or_none()
     
     if not feedback:
         raise HTTPException(
@@ -156,25 +193,29 @@ def list_action_items(
             detail="Feedback not found"
         )
     
-    action_items = db.query(ActionItem).filter(
-        ActionItem.feedback_id == feedback_id
-    ).offset(skip).limit(limit).all()
-    return action_items
+    action_items = (await db.execute(
+        select(ActionItem).where(
+            ActionItem.feedback_id == feedback_id
+        ).offset(skip).limit(limit)
+    )).scalars().all()
+    return ORJSONResponse(content=[item.to_dict() for item in action_items])
 
-@router.get("/{feedback_id}/revisions", response_model=List[RevisionResponse])
-def list_feedback_revisions(
+@router.get("/{feedback_id}/revisions", responses={200: {"model": List[RevisionResponse]}})
+async def list_feedback_revisions(
     feedback_id: UUID,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """List all revisions for a feedback"""
     # Verify feedback exists and belongs to user
-    feedback = db.query(Feedback).filter(
-        Feedback.id == feedback_id,
-        Feedback.user_id == current_user.id
-    ).first()
+    feedback = (await db.execute(
+        select(Feedback).where(
+            Feedback.id == feedback_id,
+            Feedback.user_id == user_id
+        )
+    )).scalar_one_or_none()
     
     if not feedback:
         raise HTTPException(
@@ -182,7 +223,9 @@ def list_feedback_revisions(
             detail="Feedback not found"
         )
     
-    revisions = db.query(Revision).filter(
-        Revision.feedback_id == feedback_id
-    ).order_by(Revision.version.desc()).offset(skip).limit(limit).all()
-    return revisions
+    revisions = (await db.execute(
+        select(Revision).where(
+            Revision.feedback_id == feedback_id
+        ).order_by(Revision.version.desc()).offset(skip).limit(limit)
+    )).scalars().all()
+    return ORJSONResponse(content=[revision.to_dict() for revision in revisions])
@@ -3,49 +3,71 @@ Notification Management Endpoints
 """
 from typing import Any, List
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from app.api.deps import get_db, get_current_user
-from app.models.user import User
+from app.api.deps import get_db, get_current_user_id
 from app.models.notification import Notification
 from app.schemas.notification import NotificationResponse, NotificationUpdate
 
 router = APIRouter()
 
-@router.get("/", response_model=List[NotificationResponse])
-def list_notifications(
+@router.get("/", responses={200: {"model": List[NotificationResponse]}})
+async def list_notifications(
     skip: int = 0,
     limit: int = 50,
     unread_only: bool = False,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """List user notifications"""
-    query = db.query(Notification).filter(
-        Notification.user_id == current_user.id
+    query = select(Notification).where(
+        Notification.user_id == user_id
     )
     
     if unread_only:
-        query = query.filter(Notification.is_read == False)
+        query = query.where(Notification.is_read == False)
     
-    notifications = query.order_by(
-        Notification.created_at.desc()
-    ).offset(skip).limit(limit).all()
+    notifications = (await db.execute(
+        query.order_by(
+            Notification.created_at.desc()
+        ).offset(skip).limit(limit)
+    )).scalars().all()
     
-    return notifications
+    return ORJSONResponse(content=[notification.to_dict() for notification in notifications])
 
-@router.put("/{notification_id}/read", response_model=NotificationResponse)
-def mark_notification_read(
+@router.put("/{notification_id}/read", responses={200: {"model": NotificationResponse}})
+async def mark_notification_read(
     notification_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """Mark notification as read"""
-    notification = db.query(Notification).filter(
-        Notification.id == notification_id,
-        Notification.user_id == current_user.id
-    ).first()
+    from datetime import datetime
+    
+    # Single UPDATE ... RETURNING, same bulk-update approach as read-all
+    notification = (await db.execute(
+        update(Notification).where(
+            Notification.id == notification_id,
+            Notification.user_id == user_id,
+            Notification.is_read == False
+        ).values(
+            is_read=True,
+            read_at=datetime.utcnow()
+        ).returning(Notification)
+    )).scalar_one_or_none()
+    await db.commit()
+    
+    if not notification:
+        # Nothing updated: either already read or not found
+        notification = (await db.execute(
+            select(Notification).where(
+                Notification.id == notification_id,
+                Notification.user_id == user_id
+            )
+        )).scalar_one_or_none()
     
     if not notification:
         raise HTTPException(
@@ -53,43 +75,41 @@ def mark_notification_read(
             detail="Notification not found"
         )
     
-    if not notification.is_read:
-        from datetime import datetime
-        notification.is_read = True
-        notification.read_at = datetime.utcnow()
-        db.commit()
-        db.refresh(notification)
-    
-    return notification
+    return ORJSONResponse(content=notification.to_dict())
 
 @router.put("/read-all", status_code=status.HTTP_200_OK)
-def mark_all_notifications_read(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+async def mark_all_notifications_read(
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """Mark all notifications as read"""
     from datetime import datetime
     
-    db.query(Notification).filter(
-        Notification.user_id == current_user.id,
-        Notification.is_read == False
-    ).update({
-        "is_read": True,
-        "read_at": datetime.utcnow()
-    })
+    await db.execute(
+        update(Notification).where(
+            Notification.user_id == user_id,
+            Notification.is_read == False
+        ).values(
+            is_read=True,
+            read_at=datetime.utcnow()
+        )
+    )
     
-    db.commit()
+    await db.commit()
     return {"message": "All notifications marked as read"}
 
 @router.get("/unread-count")
-def get_unread_count(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+async def get_unread_count(
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """Get count of unread notifications"""
-    count = db.query(Notification).filter(
-        Notification.user_id == current_user.id,
-        Notification.is_read == False
-    ).count()
+    # Flat SELECT count(*) ... WHERE, servable from the partial unread index
+    count = (await db.execute(
+        select(func.count()).select_from(Notification).where(
+            Notification.user_id == user_id,
+            Notification.is_read == False
+        )
+    )).scalar()
     
     return {"unread_count": count}
@@ -3,11 +3,13 @@ Project Management Endpoints
 """
 from typing import Any, List
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from uuid import UUID
 
-from app.api.deps import get_db, get_current_user
-from app.models.user import User
+from app.api.deps import get_db, get_current_user_id
 from app.models.project import Project
 from app.models.feedback import Feedback
 from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
@@ -15,46 +17,49 @@ from app.schemas.feedback import FeedbackResponse
 
 router = APIRouter()
 
-@router.get("/", response_model=List[ProjectResponse])
-def list_projects(
+@router.get("/", responses={200: {"model": List[ProjectResponse]}})
+async def list_projects(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """List all projects for current user"""
-    projects = db.query(Project).filter(
-        Project.user_id == current_user.id
-    ).offset(skip).limit(limit).all()
-    return projects
+    projects = (await db.execute(
+        select(Project).where(
+            Project.user_id == user_id
+        ).offset(skip).limit(limit)
+    )).scalars().all()
+    return ORJSONResponse(content=[project.to_dict() for project in projects])
 
 @router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
-def create_project(
+async def create_project(
     project_in: ProjectCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """Create a new project"""
-    project = Project(
-        **project_in.model_dump(),
-        user_id=current_user.id
+    project = Project.from_schema(
+        project_in,
+        user_id=user_id
     )
     db.add(project)
-    db.commit()
-    db.refresh(project)
+    await db.commit()
     return project
 
 @router.get("/{project_id}", response_model=ProjectResponse)
-def get_project(
+async def get_project(
     project_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """Get project by ID"""
-    project = db.query(Project).filter(
-        Project.id == project_id,
-        Project.user_id == current_user.id
-    ).first()
+    project = (await db.execute(
+        select(Project).where(
+            Project.id == project_id,
+            Project.user_id == user_id
+        )
+    )).scalar_one_or_none()
     
     if not project:
         raise HTTPException(
@@ -64,17 +69,19 @@ def get_project(
     return project
 
 @router.put("/{project_id}", response_model=ProjectResponse)
-def update_project(
+async def update_project(
     project_id: UUID,
     project_update: ProjectUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """Update project"""
-    project = db.query(Project).filter(
-        Project.id == project_id,
-        Project.user_id == current_user.id
-    ).first()
+    project = (await db.execute(
+        select(Project).where(
+            Project.id == project_id,
+            Project.user_id == user_id
+        )
+    )).scalar_one_or_none()
     
     if not project:
         raise HTTPException(
@@ -86,21 +93,27 @@ def update_project(
     for field, value in update_data.items():
         setattr(project, field, value)
     
-    db.commit()
-    db.refresh(project)
+    await db.commit()
     return project
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_project(
+async def delete_project(
     project_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> None:
     """Delete project"""
-    project = db.query(Project).filter(
-        Project.id == project_id,
-        Project.user_id == current_user.id
-    ).first()
+    # Load the whole cascade up front: one IN query per level instead of
+    # lazy-loading revisions and action items feedback by feedback
+    project = (await db.execute(
+        select(Project).where(
+            Project.id == project_id,
+            Project.user_id == user_id
+        ).options(
+            selectinload(Project.feedbacks).selectinload(Feedback.revisions),
+            selectinload(Project.feedbacks).selectinload(Feedback.action_items)
+        )
+    )).scalar_one_or_none()
     
     if not project:
         raise HTTPException(
@@ -108,23 +121,25 @@ def delete_project(
             detail="Project not found"
         )
     
-    db.delete(project)
-    db.commit()
+    await db.delete(project)
+    await db.commit()
 
-@router.get("/{project_id}/feedback", response_model=List[FeedbackResponse])
-def list_project_feedback(
+@router.get("/{project_id}/feedback", responses={200: {"model": List[FeedbackResponse]}})
+async def list_project_feedback(
     project_id: UUID,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """List all feedback for a project"""
     # Verify project exists and belongs to user
-    project = db.query(Project).filter(
-        Project.id == project_id,
-        Project.user_id == current_user.id
-    ).first()
+    project = (await db.execute(
+        select(Project).where(
+            Project.id == project_id,
+            Project.user_id == user_id
+        )
+    )).scalar_one_or_none()
     
     if not project:
         raise HTTPException(
@@ -132,8 +147,10 @@ def list_project_feedback(
             detail="Project not found"
         )
     
-    feedbacks = db.query(Feedback).filter(
-        Feedback.project_id == project_id,
-        Feedback.user_id == current_user.id
-    ).offset(skip).limit(limit).all()
-    return feedbacks
+    feedbacks = (await db.execute(
+        select(Feedback).where(
+            Feedback.project_id == project_id,
+            Feedback.user_id == user_id
+        ).offset(skip).limit(limit)
+    )).scalars().all()
+    return ORJSONResponse(content=[feedback.to_dict() for feedback in feedbacks])
@@ -3,31 +3,38 @@ Revision Management Endpoints
 """
 from typing import Any, List
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from app.api.deps import get_db, get_current_user
-from app.models.user import User
+from app.api.deps import get_db, get_current_user_id
 from app.models.revision import Revision
 from app.models.feedback import Feedback
 from app.schemas.revision import RevisionCreate, RevisionUpdate, RevisionResponse
+from app.services.storage_service import delete_from_storage, stream_to_storage
 
 router = APIRouter()
 
+MAX_VERSION_ATTEMPTS = 3
+
 @router.post("/", response_model=RevisionResponse, status_code=status.HTTP_201_CREATED)
 async def create_revision(
     feedback_id: UUID,
     notes: str = None,
     file: UploadFile = File(None),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """Upload a new revision"""
     # Verify feedback exists and belongs to user
-    feedback = db.query(Feedback).filter(
-        Feedback.id == feedback_id,
-        Feedback.user_id == current_user.id
-    ).first()
+    feedback = (await db.execute(
+        select(Feedback).where(
+            Feedback.id == feedback_id,
+            Feedback.user_id == user_id
+        )
+    )).scalar_one_or_none()
     
     if not feedback:
         raise HTTPException(
@@ -35,44 +42,62 @@ async def create_revision(
             detail="Feedback not found"
         )
     
-    # Get next version number
-    last_revision = db.query(Revision).filter(
-        Revision.feedback_id == feedback_id
-    ).order_by(Revision.version.desc()).first()
-    
-    next_version = (last_revision.version + 1) if last_revision else 1
-    
-    # Create revision
-    revision = Revision(
-        feedback_id=feedback_id,
-        version=next_version,
-        notes=notes,
-        status="pending"
-    )
+    values = {
+        "feedback_id": feedback_id,
+        "notes": notes,
+        "status": "pending",
+    }
     
-    # Handle file upload if provided
+    # Stream the upload to storage before inserting the row
     if file:
-        # TODO: Implement file storage
-        revision.file_name = file.filename
-        revision.file_type = file.content_type
+        values["file_url"], values["file_size"] = await stream_to_storage(file, str(feedback_id))
+        values["file_name"] = file.filename
+        values["file_type"] = file.content_type
     
-    db.add(revision)
-    db.commit()
-    db.refresh(revision)
+    # Assign the next version inside the INSERT itself; the unique
+    # (feedback_id, version) index turns a concurrent collision into a retry
+    next_version = select(
+        func.coalesce(func.max(Revision.version), 0) + 1
+    ).where(
+        Revision.feedback_id == feedback_id
+    ).scalar_subquery()
+    
+    try:
+        for attempt in range(MAX_VERSION_ATTEMPTS):
+            try:
+                revision = (await db.execute(
+                    insert(Revision).values(version=next_version, **values).returning(Revision)
+                )).scalar_one()
+                await db.commit()
+                break
+            except IntegrityError:
+                await db.rollback()
+                if attempt == MAX_VERSION_ATTEMPTS - 1:
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail="Could not assign a revision version, please retry"
+                    )
+    except BaseException:
+        # No row points at the stored file, so don't leave it behind
+        if "file_url" in values:
+            await delete_from_storage(values["file_url"])
+        raise
     
     return revision
 
 @router.get("/{revision_id}", response_model=RevisionResponse)
-def get_revision(
+async def get_revision(
     revision_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """Get revision by ID"""
-    revision = db.query(Revision).join(Feedback).filter(
-        Revision.id == revision_id,
-        Feedback.user_id == current_user.id
-    ).first()
+    revision = (await db.execute(
+        select(Revision).join(Feedback).where(
+            Revision.id == revision_id,
+            Feedback.user_id == user_id
+        )
+    )).scalar_one_or_none()
     
     if not revision:
         raise HTTPException(
@@ -81,18 +106,20 @@ def get_revision(
         )
     return revision
 
-@router.get("/feedback/{feedback_id}/revisions", response_model=List[RevisionResponse])
-def list_feedback_revisions(
+@router.get("/feedback/{feedback_id}/revisions", responses={200: {"model": List[RevisionResponse]}})
+async def list_feedback_revisions(
     feedback_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """List all revisions for a feedback"""
     # Verify feedback exists and belongs to user
-    feedback = db.query(Feedback).filter(
-        Feedback.id == feedback_id,
-        Feedback.user_id == current_user.id
-    ).first()
+    feedback = (await db.execute(
+        select(Feedback).where(
+            Feedback.id == feedback_id,
+            Feedback.user_id == user_id
+        )
+    )).scalar_one_or_none()
     
     if not feedback:
         raise HTTPException(
@@ -100,23 +127,27 @@ def list_feedback_revisions(
             detail="Feedback not found"
         )
     
-    revisions = db.query(Revision).filter(
-        Revision.feedback_id == feedback_id
-    ).order_by(Revision.version.desc()).all()
-    return revisions
+    revisions = (await db.execute(
+        select(Revision).where(
+            Revision.feedback_id == feedback_id
+        ).order_by(Revision.version.desc())
+    )).scalars().all()
+    return ORJSONResponse(content=[revision.to_dict() for revision in revisions])
 
 @router.put("/{revision_id}", response_model=RevisionResponse)
-def update_revision(
+async def update_revision(
     revision_id: UUID,
     revision_update: RevisionUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ) -> Any:
     """Update revision status or notes"""
-    revision = db.query(Revision).join(Feedback).filter(
-        Revision.id == revision_id,
-        Feedback.user_id == current_user.id
-    ).first()
+    revision = (await db.execute(
+        select(Revision).join(Feedback).where(
+            Revision.id == revision_id,
+            Feedback.user_id == user_id
+        )
+    )).scalar_one_or_none()
     
     if not revision:
         raise HTTPException(
@@ -132,6 +163,5 @@ def update_revision(
         from datetime import datetime
         revision.approved_at = datetime.utcnow()
     
-    db.commit()
-    db.refresh(revision)
+    await db.commit()
     return revision
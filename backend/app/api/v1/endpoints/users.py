@@ -3,7 +3,8 @@ User Management Endpoints
 """
 from typing import Any, List
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.api.deps import get_db, get_current_user
@@ -13,16 +14,16 @@ from app.schemas.user import UserResponse, UserUpdate
 router = APIRouter()
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_profile(
+async def get_current_user_profile(
     current_user: User = Depends(get_current_user)
 ) -> Any:
     """Get current user profile"""
     return current_user
 
 @router.put("/me", response_model=UserResponse)
-def update_current_user(
+async def update_current_user(
     user_update: UserUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> Any:
     """Update current user profile"""
@@ -32,17 +33,19 @@ def update_current_user(
         current_user.full_name = user_update.full_name
     if user_update.password:
         from app.core.security import get_password_hash
-        current_user.hashed_password = get_password_hash(user_update.password)
+        # bcrypt is CPU-bound; keep it off the event loop
+        current_user.hashed_password = await run_in_threadpool(get_password_hash, user_update.password)
     
-    db.commit()
-    db.refresh(current_user)
+    # No refresh: user columns have no server-side defaults or triggers, and
+    # updated_at's onupdate runs in Python, so the in-memory row is current
+    await db.commit()
     return current_user
 
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
-def delete_current_user(
-    db: Session = Depends(get_db),
+async def delete_current_user(
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> None:
     """Delete current user account"""
-    db.delete(current_user)
-    db.commit()
+    await db.delete(current_user)
+    await db.commit()
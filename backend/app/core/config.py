@@ -32,15 +32,16 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
-    BCRYPT_ROUNDS: int = 12
+    BCRYPT_ROUNDS: int = Field(12, ge=4, le=31)
     
     # Database
     DATABASE_URL: str = Field(..., description="PostgreSQL connection string")
     DB_POOL_SIZE: int = 20
     DB_MAX_OVERFLOW: int = 10
     DB_POOL_TIMEOUT: int = 30
-    DB_POOL_RECYCLE: int = 3600
+    DB_POOL_RECYCLE: int = 1800
     DB_ECHO: bool = False
+    DB_PGBOUNCER: bool = False  # Transaction-mode PgBouncer in front of Postgres
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -52,9 +53,11 @@ class Settings(BaseSettings):
     BLACKBOX_API_KEY: str = Field(default="sk-test-key", description="Blackbox API key")
     OPENAI_BASE_URL: str = "https://api.blackbox.ai/v1"  # Blackbox API endpoint
     OPENAI_MODEL: str = "blackboxai-pro"  # Blackbox AI model
+    OPENAI_MODEL_CHEAP: Optional[str] = None  # Smaller model tried first for short feedback
     OPENAI_MAX_TOKENS: int = 1000
     OPENAI_TEMPERATURE: float = 0.7
     OPENAI_TIMEOUT: int = 120
+    OPENAI_RPM: int = 60  # Requests per minute allowed by the API key
     
     # AI Settings
     AI_CACHE_ENABLED: bool = True
@@ -72,6 +75,7 @@ class Settings(BaseSettings):
     CELERY_TASK_TRACK_STARTED: bool = True
     CELERY_TASK_TIME_LIMIT: int = 300
     CELERY_TASK_SOFT_TIME_LIMIT: int = 240
+    FEEDBACK_BATCH_POLL_SECONDS: int = Field(300, gt=0)  # How often beat applies finished feedback batches
     
     @field_validator("CELERY_ACCEPT_CONTENT", mode="before")
     @classmethod
@@ -129,6 +133,10 @@ class Settings(BaseSettings):
     RATE_LIMIT_ENABLED: bool = True
     RATE_LIMIT_PER_MINUTE: int = 60
     RATE_LIMIT_AUTH_PER_MINUTE: int = 5
+    RATE_LIMIT_REGISTER_PER_HOUR: int = 3
+    # Reverse proxies (IPs or CIDR networks) whose X-Real-IP / X-Forwarded-For
+    # headers are believed when keying rate limits; empty trusts no one
+    TRUSTED_PROXIES: Union[str, List[str]] = ""
     
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -209,6 +217,14 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(",") if origin.strip()]
         return v if v else ["http://localhost:3000", "http://localhost:5173"]
     
+    @field_validator("TRUSTED_PROXIES", mode="before")
+    @classmethod
+    def parse_trusted_proxies(cls, v):
+        """Parse trusted proxies from string or list"""
+        if isinstance(v, str):
+            return [proxy.strip() for proxy in v.split(",") if proxy.strip()]
+        return v or []
+    
     @field_validator("ALLOWED_FILE_EXTENSIONS", mode="before")
     @classmethod
     def parse_file_extensions(cls, v):
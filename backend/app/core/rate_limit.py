@@ -0,0 +1,57 @@
+"""
+Rate Limiting
+Shared slowapi limiter, backed by Redis so limits hold across workers
+"""
+
+from ipaddress import ip_address, ip_network
+
+from fastapi import Request
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from app.core.config import settings
+
+TRUSTED_PROXY_NETWORKS = tuple(ip_network(proxy, strict=False) for proxy in settings.TRUSTED_PROXIES)
+
+
+def client_ip(request: Request) -> str:
+    """
+    Address of the client making the request
+    Behind a trusted proxy (nginx) the peer is the proxy itself, so the client
+    comes from the X-Real-IP it sets, or else the last X-Forwarded-For hop it
+    appended. Anyone else's forwarding headers are ignored, since they can be forged
+    """
+    peer = get_remote_address(request)
+    try:
+        trusted = any(ip_address(peer) in network for network in TRUSTED_PROXY_NETWORKS)
+    except ValueError:
+        trusted = False
+    if not trusted:
+        return peer
+    real_ip = request.headers.get("x-real-ip", "").strip()
+    if real_ip:
+        return real_ip
+    forwarded = request.headers.get("x-forwarded-for", "").split(",")[-1].strip()
+    return forwarded or peer
+
+
+def auth_rate_limit_key(request: Request) -> str:
+    """
+    Key auth attempts by client IP and submitted email
+    Uses the JSON body FastAPI has already parsed for the endpoint
+    """
+    body = getattr(request, "_json", None)
+    email = body.get("email", "") if isinstance(body, dict) else ""
+    return f"{client_ip(request)}:{str(email).lower()}"
+
+
+limiter = Limiter(
+    key_func=client_ip,
+    storage_uri=settings.REDIS_URL,
+    in_memory_fallback_enabled=True,
+    headers_enabled=True,
+    enabled=settings.RATE_LIMIT_ENABLED,
+)
+
+LOGIN_RATE_LIMIT = f"{settings.RATE_LIMIT_AUTH_PER_MINUTE}/minute"
+REGISTER_RATE_LIMIT = f"{settings.RATE_LIMIT_REGISTER_PER_HOUR}/hour"
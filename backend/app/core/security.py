@@ -3,8 +3,11 @@ Security utilities
 JWT token handling, password hashing, and authentication
 """
 
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+from uuid import UUID
 
 import bcrypt
 from jose import JWTError, jwt
@@ -12,6 +15,10 @@ from fastapi import HTTPException, status
 
 from app.core.config import settings
 
+# Verified access tokens -> (user id, expiry timestamp), least recently used first
+ACCESS_TOKEN_CACHE_SIZE = 8192
+_access_token_cache: "OrderedDict[str, Tuple[UUID, float]]" = OrderedDict()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -49,7 +56,7 @@ def get_password_hash(password: str) -> str:
     """
     # Truncate password to 72 bytes (bcrypt limitation)
     password_bytes = password.encode('utf-8')[:72]
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode('utf-8')
 
@@ -178,6 +185,44 @@ def verify_token_type(payload: Dict[str, Any], expected_type: str) -> None:
         )
 
 
+def get_access_token_subject(token: str) -> UUID:
+    """
+    Resolve the user id of an access token
+    
+    Verified tokens are memoized until their own expiry, so repeated
+    requests with the same token skip the signature check
+    
+    Args:
+        token: JWT access token
+        
+    Returns:
+        User id from the token's subject
+        
+    Raises:
+        HTTPException: If token is invalid, expired or not an access token
+        ValueError: If the subject is not a valid UUID
+    """
+    cached = _access_token_cache.get(token)
+    if cached is not None:
+        user_id, expires_at = cached
+        if expires_at > time.time():
+            _access_token_cache.move_to_end(token)
+            return user_id
+        del _access_token_cache[token]
+    
+    payload = decode_token(token)
+    verify_token_type(payload, "access")
+    user_id = UUID(str(payload.get("sub")))
+    
+    expires_at = payload.get("exp")
+    if expires_at is not None:
+        _access_token_cache[token] = (user_id, float(expires_at))
+        if len(_access_token_cache) > ACCESS_TOKEN_CACHE_SIZE:
+            _access_token_cache.popitem(last=False)
+    
+    return user_id
+
+
 def create_token_pair(user_id: str, email: str) -> Dict[str, str]:
     """
     Create both access and refresh tokens for a user
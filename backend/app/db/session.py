@@ -3,6 +3,9 @@ Database Session Management
 SQLAlchemy engine and session configuration
 """
 
+from typing import Type, TypeVar
+
+from pydantic import BaseModel
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
@@ -10,8 +13,22 @@ from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
+ModelT = TypeVar("ModelT", bound="ModelMixin")
+
+
+class ModelMixin:
+    """Helpers shared by every model"""
+    
+    @classmethod
+    def from_schema(cls: Type[ModelT], schema: BaseModel, **extra) -> ModelT:
+        """Build a model from a validated schema, copying fields that map to columns"""
+        columns = cls.__table__.columns
+        values = {name: getattr(schema, name) for name in schema.model_fields if name in columns}
+        return cls(**values, **extra)
+
+
 # Create SQLAlchemy Base class
-Base = declarative_base()
+Base = declarative_base(cls=ModelMixin)
 
 # Create synchronous engine
 # SQLite doesn't support pool settings, so we conditionally apply them
@@ -36,11 +53,16 @@ else:
     )
 
 # Create session factory
+# expire_on_commit=False keeps committed objects loaded, so endpoints can
+# return them without a refresh SELECT. This relies on all column defaults
+# (ids, timestamps) being generated in Python and so already known in memory;
+# add eager_defaults to a mapper if it ever gains server-side defaults.
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine,
     class_=Session,
+    expire_on_commit=False,
 )
 
 # Create async engine (for async operations)
@@ -55,6 +77,11 @@ if is_sqlite:
     )
 else:
     async_db_url = db_url.replace("postgresql://", "postgresql+asyncpg://")
+    # Transaction-mode PgBouncer hands each transaction to any server
+    # connection, so asyncpg's per-connection prepared statements must be off
+    async_connect_args = {}
+    if settings.DB_PGBOUNCER:
+        async_connect_args = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
     async_engine = create_async_engine(
         async_db_url,
         pool_size=settings.DB_POOL_SIZE,
@@ -62,7 +89,9 @@ else:
         pool_timeout=settings.DB_POOL_TIMEOUT,
         pool_recycle=settings.DB_POOL_RECYCLE,
         echo=settings.DB_ECHO,
+        pool_pre_ping=True,  # Verify connections before using
         poolclass=NullPool if settings.is_testing else None,
+        connect_args=async_connect_args,
     )
 
 # Create async session factory
@@ -6,19 +6,20 @@ FastAPI application with AI-powered feedback parsing
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from prometheus_client import make_asgi_app
-from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
 
 from app.api.v1.api import api_router
 from app.core.config import settings
 from app.core.logging_config import setup_logging
+from app.core.rate_limit import limiter
+from app.core.security import get_access_token_subject
 from app.db.session import engine, Base
 
 # Set up logging
@@ -52,9 +53,6 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     logger.info("Application shutdown complete")
 
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
-
 # Create FastAPI application
 app = FastAPI(
     title=settings.APP_NAME,
@@ -64,6 +62,7 @@ app = FastAPI(
     redoc_url="/redoc" if settings.DEBUG else None,
     openapi_url="/openapi.json" if settings.DEBUG else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add rate limiting
@@ -177,6 +176,40 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
     )
 
 
+# Request size middleware
+@app.middleware("http")
+async def limit_request_size(request: Request, call_next):
+    """
+    Reject oversized uploads from Content-Length before the body is read
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > settings.max_upload_size_bytes:
+        return JSONResponse(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            content={"detail": f"Request exceeds the {settings.MAX_UPLOAD_SIZE_MB} MB upload limit"},
+        )
+    
+    return await call_next(request)
+
+
+# Authentication middleware
+@app.middleware("http")
+async def authenticate_request(request: Request, call_next):
+    """
+    Decode the bearer token once per request
+    Stores the user id on request.state for the auth dependencies
+    """
+    request.state.user_id = None
+    authorization = request.headers.get("authorization")
+    if authorization and authorization[:7].lower() == "bearer ":
+        try:
+            request.state.user_id = get_access_token_subject(authorization[7:])
+        except (HTTPException, ValueError):
+            pass
+    
+    return await call_next(request)
+
+
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
@@ -3,11 +3,12 @@ Feedback Model
 Represents client feedback with AI-parsed summaries
 """
 
+import hashlib
 import uuid
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, Text, JSON
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text, JSON, UniqueConstraint, event
 from sqlalchemy.orm import relationship
 
 from app.db.session import Base
@@ -20,6 +21,13 @@ class Feedback(Base):
     """
     
     __tablename__ = "feedbacks"
+    __table_args__ = (
+        # Match the per-user lookup and per-project listing filters
+        Index("ix_feedbacks_user_id_id", "user_id", "id"),
+        Index("ix_feedbacks_project_id_user_id", "project_id", "user_id"),
+        # Reject duplicate submissions with a fixed-width hash lookup instead of comparing TEXT
+        UniqueConstraint("user_id", "project_id", "raw_text_sha256", name="uq_feedback_dedup"),
+    )
     
     # Primary key
     id = Column(UUID(), primary_key=True, default=uuid.uuid4, index=True)
@@ -30,6 +38,7 @@ class Feedback(Base):
     
     # Feedback content
     raw_text = Column(Text, nullable=False)
+    raw_text_sha256 = Column(String(64), nullable=False)  # Hex digest of raw_text, set on insert/update
     summary = Column(JSON, nullable=True)  # AI-generated summary as JSON (using JSON instead of JSONB for SQLite compatibility)
     
     # AI analysis
@@ -38,6 +47,7 @@ class Feedback(Base):
     
     # Status
     status = Column(String(50), default="pending", nullable=False)  # pending, in_progress, completed, archived
+    batch_id = Column(String(100), nullable=True, index=True)  # Pending Batch API job, if queued for offline parsing
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
@@ -66,3 +76,15 @@ class Feedback(Base):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+
+def raw_text_digest(raw_text: str) -> str:
+    """SHA-256 hex digest of feedback text, as stored in raw_text_sha256"""
+    return hashlib.sha256(raw_text.encode("utf-8")).hexdigest()
+
+
+@event.listens_for(Feedback, "before_insert")
+@event.listens_for(Feedback, "before_update")
+def set_raw_text_sha256(mapper, connection, target: Feedback) -> None:
+    """Keep raw_text_sha256 in step with raw_text"""
+    target.raw_text_sha256 = raw_text_digest(target.raw_text)
@@ -6,7 +6,7 @@ Represents user notifications for feedback and approvals
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, Text, JSON
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String, Text, JSON, text
 from sqlalchemy.orm import relationship
 
 from app.db.session import Base
@@ -19,6 +19,19 @@ class Notification(Base):
     """
     
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Matches the per-user lookup filter (id + user_id)
+        Index("ix_notifications_user_id_id", "user_id", "id"),
+        # Partial index over unread rows only: keeps the unread count and
+        # unread_only listing proportional to the number of unread notifications
+        Index(
+            "ix_notifications_user_unread",
+            "user_id",
+            "created_at",
+            postgresql_where=text("is_read = false"),
+            sqlite_where=text("is_read = 0"),
+        ),
+    )
     
     # Primary key
     id = Column(UUID(), primary_key=True, default=uuid.uuid4, index=True)
@@ -7,7 +7,7 @@ import uuid
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text
 
 from sqlalchemy.orm import relationship
 
@@ -21,6 +21,10 @@ class Project(Base):
     """
     
     __tablename__ = "projects"
+    __table_args__ = (
+        # Matches the per-user lookup filter (id + user_id)
+        Index("ix_projects_user_id_id", "user_id", "id"),
+    )
     
     # Primary key
     id = Column(UUID(), primary_key=True, default=uuid.uuid4, index=True)
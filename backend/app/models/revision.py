@@ -6,7 +6,7 @@ Represents file revisions and version tracking
 import uuid
 from datetime import datetime
 
-from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, Integer, String, Text
 
 from sqlalchemy.orm import relationship
 
@@ -20,6 +20,11 @@ class Revision(Base):
     """
     
     __tablename__ = "revisions"
+    __table_args__ = (
+        # Revisions are always listed per feedback, newest version first;
+        # uniqueness also guards version assignment against concurrent uploads
+        Index("ix_revisions_feedback_id_version", "feedback_id", "version", unique=True),
+    )
     
     # Primary key
     id = Column(UUID(), primary_key=True, default=uuid.uuid4, index=True)
@@ -34,6 +34,10 @@ from app.schemas.notification import (
     NotificationResponse,
     NotificationUpdate,
 )
+from app.schemas.batch import (
+    BatchOperation,
+    BatchResult,
+)
 from app.schemas.token import (
     Token,
     TokenPayload,
@@ -66,6 +70,9 @@ __all__ = [
     # Notification
     "NotificationResponse",
     "NotificationUpdate",
+    # Batch
+    "BatchOperation",
+    "BatchResult",
     # Token
     "Token",
     "TokenPayload",
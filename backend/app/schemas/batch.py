@@ -0,0 +1,17 @@
+"""
+Batch Schemas
+"""
+from typing import Optional, Dict, Any, Literal
+from pydantic import BaseModel, Field
+
+class BatchOperation(BaseModel):
+    id: str = Field(..., min_length=1, max_length=50, pattern=r"^\w+$")
+    method: Literal["GET", "POST", "PUT", "DELETE"] = "GET"
+    path: str = Field(..., min_length=1, pattern=r"^/")
+    body: Optional[Any] = None
+    params: Optional[Dict[str, Any]] = None
+
+class BatchResult(BaseModel):
+    id: str
+    status: int
+    body: Optional[Any] = None
@@ -2,80 +2,429 @@
 AI Service for Feedback Parsing
 Blackbox AI integration for parsing creative feedback
 """
-import json
-from typing import Dict, List, Any, Optional
-from openai import OpenAI
+import asyncio
+import hashlib
+import time
+from typing import Dict, List, Any, Optional, Union
+import orjson
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    InternalServerError,
+    RateLimitError,
+)
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from app.core.config import settings
 from app.core.logging_config import logger
+from app.models.action_item import ActionItem
+from app.models.feedback import Feedback
 
 # Configure OpenAI client to use Blackbox API endpoint
-client = OpenAI(
+# Async client, so in-flight completions don't block the event loop
+client = AsyncOpenAI(
     api_key=settings.BLACKBOX_API_KEY,
-    base_url="https://api.blackbox.ai/v1"  # Blackbox API endpoint
+    base_url="https://api.blackbox.ai/v1",  # Blackbox API endpoint
+    max_retries=0  # Retries are handled by _create_completion
 )
 
-FEEDBACK_PARSING_PROMPT = """
-You are an expert at analyzing creative feedback and extracting actionable tasks.
-
-Given the following client feedback, please:
-1. Extract specific, actionable tasks
-2. Determine the sentiment (positive, neutral, negative)
-3. Assign a priority level (low, medium, high, urgent)
-4. Provide a clear summary
-
-Feedback: {feedback_text}
-
-Respond in JSON format:
-{{
-  "summary": "Brief summary of the feedback",
-  "sentiment": "positive|neutral|negative",
-  "priority": "low|medium|high|urgent",
-  "action_items": [
-    {{
-      "description": "Specific actionable task",
-      "priority": 0-3
-    }}
-  ],
-  "key_points": ["point 1", "point 2"]
-}}
-"""
+class AdaptiveTokenBucket:
+    """
+    Client-side rate limiter for API calls
+    
+    Tokens refill at an adaptive rate: it grows additively after each
+    success and is cut multiplicatively on a 429, so the request rate
+    settles just under the quota actually granted by the provider
+    """
+    
+    def __init__(self, capacity: int, rate: float, increase: float = 0.05, decrease: float = 0.5):
+        self.capacity = capacity
+        self.max_rate = rate
+        self.min_rate = rate / 60
+        self.rate = rate
+        self.increase = increase * rate
+        self.decrease = decrease
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+    
+    def increase_rate(self) -> None:
+        """Speed up after a successful call"""
+        self.rate = min(self.max_rate, self.rate + self.increase)
+    
+    def decrease_rate(self) -> None:
+        """Back off after being rate limited"""
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        self.tokens = min(self.tokens, 0.0)
+
+# Shared by every parse call in this process
+_bucket = AdaptiveTokenBucket(capacity=settings.OPENAI_RPM, rate=settings.OPENAI_RPM / 60)
+
+# Parsed results shared across processes, keyed by prompt version, model and text hash
+_cache = Redis.from_url(
+    settings.REDIS_URL,
+    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+) if settings.AI_CACHE_ENABLED else None
+
+# Completions currently running, keyed by text hash and model
+_in_flight: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+FEEDBACK_MODEL = "blackboxai-pro"  # Blackbox AI model
+PROMPT_VERSION = "v2"  # Bump when FEEDBACK_PARSING_PROMPT changes to invalidate cached results
+CHEAP_MODEL_MAX_CHARS = 2000  # Longer feedback goes straight to FEEDBACK_MODEL
+BATCH_ENDPOINT = "/v1/chat/completions"
+MAX_COMPLETION_ATTEMPTS = 8
+
+SENTIMENTS = {"positive", "neutral", "negative"}
+PRIORITIES = {"low", "medium", "high", "urgent"}
+
+# Sent as the system message on every call; the feedback itself is the
+# whole user message, so keep this short
+FEEDBACK_PARSING_PROMPT = (
+    "Turn client feedback on creative work into specific, actionable tasks. "
+    'Reply with JSON only: {"summary": str, "sentiment": "positive"|"neutral"|"negative", '
+    '"priority": "low"|"medium"|"high"|"urgent", '
+    '"action_items": [{"description": str, "priority": 0-3}], "key_points": [str]}'
+)
+
+def _completion_request(feedback_text: str, model: str = FEEDBACK_MODEL) -> Dict[str, Any]:
+    """Build the chat completion request body for one feedback text"""
+    # Use Blackbox AI model endpoint
+    # Format: /chat/completions/blackboxai/openai/gpt-4o
+    return {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": FEEDBACK_PARSING_PROMPT},
+            {"role": "user", "content": feedback_text}
+        ],
+        "max_tokens": settings.OPENAI_MAX_TOKENS,
+        "temperature": settings.OPENAI_TEMPERATURE,
+        "response_format": {"type": "json_object"}
+    }
+
+def _model_chain(feedback_text: str) -> List[str]:
+    """Models to try in order: the cheap model for short feedback, then FEEDBACK_MODEL"""
+    if settings.OPENAI_MODEL_CHEAP and len(feedback_text) <= CHEAP_MODEL_MAX_CHARS:
+        return [settings.OPENAI_MODEL_CHEAP, FEEDBACK_MODEL]
+    return [FEEDBACK_MODEL]
 
-async def parse_feedback(feedback_text: str) -> Dict[str, Any]:
+def _decode_valid_parse(content: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Decode a completion, returning None unless it matches the expected shape"""
+    try:
+        result = orjson.loads(content or "")
+    except ValueError:
+        return None
+    
+    if not isinstance(result, dict) or not isinstance(result.get("summary"), str):
+        return None
+    if result.get("sentiment") not in SENTIMENTS or result.get("priority") not in PRIORITIES:
+        return None
+    action_items = result.get("action_items")
+    if not isinstance(action_items, list) or not all(
+        isinstance(item, dict) and isinstance(item.get("description"), str) for item in action_items
+    ):
+        return None
+    return result
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    """Log each backoff so climbing retry counts are visible"""
+    logger.warning(
+        "Retrying AI completion",
+        extra={
+            "attempt": retry_state.attempt_number,
+            "wait": retry_state.next_action.sleep if retry_state.next_action else None,
+            "error": str(retry_state.outcome.exception()) if retry_state.outcome else None,
+        }
+    )
+
+# Transient failures (429, timeouts, dropped connections, 5xx) are retried
+# with full-jitter exponential backoff; bad model output is not
+@retry(
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError, InternalServerError)),
+    wait=wait_random_exponential(multiplier=1, max=60),
+    stop=stop_after_attempt(MAX_COMPLETION_ATTEMPTS),
+    before_sleep=_log_retry,
+    reraise=True,
+)
+async def _create_completion(request: Dict[str, Any]) -> Any:
+    """Send one throttled chat completion request"""
+    await _bucket.acquire()
+    try:
+        response = await client.chat.completions.create(**request)
+    except RateLimitError:
+        _bucket.decrease_rate()
+        raise
+    _bucket.increase_rate()
+    return response
+
+async def parse_feedback(feedback_text: str, digest: Optional[str] = None) -> Dict[str, Any]:
     """
     Parse feedback using OpenAI GPT-4
     
+    Concurrent calls for identical text share a single completion
+    
     Args:
         feedback_text: Raw feedback text from client
+        digest: SHA-256 hex digest of the text, e.g. Feedback.raw_text_sha256
         
     Returns:
         Parsed feedback with action items, sentiment, and priority
     """
+    models = _model_chain(feedback_text)
+    digest = digest or hashlib.sha256(feedback_text.encode("utf-8")).hexdigest()
+    key = f"{digest}:{'>'.join(models)}"
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.create_task(_parse_feedback(feedback_text, models, key))
+        _in_flight[key] = task
+        task.add_done_callback(lambda _: _in_flight.pop(key, None))
+    
+    # Shielded so one caller giving up doesn't cancel the others' result
+    return await asyncio.shield(task)
+
+async def parse_feedback_many(
+    feedback_texts: List[str],
+    max_concurrency: int = 16
+) -> List[Union[Dict[str, Any], BaseException]]:
+    """
+    Parse several feedback texts concurrently
+    
+    Args:
+        feedback_texts: Raw feedback texts
+        max_concurrency: Maximum completions in flight at once
+        
+    Returns:
+        Parsed feedback, or the raised exception, for each text in order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def parse_one(feedback_text: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await parse_feedback(feedback_text)
+    
+    return await asyncio.gather(
+        *(parse_one(feedback_text) for feedback_text in feedback_texts),
+        return_exceptions=True
+    )
+
+async def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """Read a cached parse result; cache outages are treated as misses"""
+    if _cache is None:
+        return None
+    try:
+        cached = await _cache.get(key)
+    except RedisError as e:
+        logger.warning(f"AI cache read failed: {str(e)}")
+        return None
+    return orjson.loads(cached) if cached else None
+
+async def _cache_set(key: str, result: Dict[str, Any]) -> None:
+    """Store a parse result, ignoring cache outages"""
+    if _cache is None:
+        return
+    try:
+        await _cache.set(key, orjson.dumps(result), ex=settings.AI_CACHE_TTL)
+    except RedisError as e:
+        logger.warning(f"AI cache write failed: {str(e)}")
+
+async def _parse_feedback(feedback_text: str, models: List[str], key: str) -> Dict[str, Any]:
+    """Run the completion for one feedback text and decode the result"""
+    cache_key = f"feedback_parse:{PROMPT_VERSION}:{key}"
+    cached = await _cache_get(cache_key)
+    if cached is not None:
+        logger.info("Using cached feedback parse", extra={"text_length": len(feedback_text)})
+        return cached
+    
     try:
         logger.info("Parsing feedback with AI", extra={"text_length": len(feedback_text)})
         
-        # Use Blackbox AI model endpoint
-        # Format: /chat/completions/blackboxai/openai/gpt-4o
-        response = client.chat.completions.create(
-            model="blackboxai-pro",  # Blackbox AI model
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant that analyzes creative feedback."},
-                {"role": "user", "content": FEEDBACK_PARSING_PROMPT.format(feedback_text=feedback_text)}
-            ],
-            max_tokens=settings.OPENAI_MAX_TOKENS,
-            temperature=settings.OPENAI_TEMPERATURE,
-            response_format={"type": "json_object"}
-        )
+        # Cheaper models answer first; escalate when their output is malformed
+        for model in models[:-1]:
+            response = await _create_completion(_completion_request(feedback_text, model))
+            result = _decode_valid_parse(response.choices[0].message.content)
+            if result is not None:
+                break
+            logger.info("Escalating feedback parse", extra={"model": model})
+        else:
+            response = await _create_completion(_completion_request(feedback_text, models[-1]))
+            result = orjson.loads(response.choices[0].message.content)
         
-        result = json.loads(response.choices[0].message.content)
         logger.info("Successfully parsed feedback", extra={"action_items": len(result.get("action_items", []))})
         
+        await _cache_set(cache_key, result)
         return result
         
     except Exception as e:
         logger.error(f"Error parsing feedback: {str(e)}", exc_info=True)
         raise
 
+async def submit_feedback_batch(db: AsyncSession, feedbacks: List[Feedback]) -> str:
+    """
+    Queue feedback for offline parsing through the Batch API
+    
+    Batch requests cost half as much and draw on a separate rate limit
+    pool; use this for backfills and bulk re-parses, not interactive calls
+    
+    Args:
+        db: Session the feedback rows belong to
+        feedbacks: Feedback rows to parse
+        
+    Returns:
+        Batch id, stored on each feedback for apply_feedback_batches to pick up
+    """
+    lines = [
+        orjson.dumps({
+            "custom_id": str(feedback.id),
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": _completion_request(feedback.raw_text),
+        })
+        for feedback in feedbacks
+    ]
+    input_file = await client.files.create(
+        file=("feedback_batch.jsonl", b"\n".join(lines)),
+        purpose="batch"
+    )
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window="24h"
+    )
+    logger.info("Submitted feedback batch", extra={"batch_id": batch.id, "count": len(lines)})
+    
+    for feedback in feedbacks:
+        feedback.batch_id = batch.id
+    await db.commit()
+    return batch.id
+
+async def collect_feedback_batch(batch_id: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Fetch the results of a feedback batch
+    
+    Args:
+        batch_id: Id returned by submit_feedback_batch
+        
+    Returns:
+        Parsed feedback keyed by feedback id, or None while the batch is still running
+        
+    Raises:
+        RuntimeError: If the batch failed, expired or was cancelled
+    """
+    batch = await client.batches.retrieve(batch_id)
+    if batch.status in ("failed", "expired", "cancelled"):
+        raise RuntimeError(f"Feedback batch {batch_id} ended with status {batch.status}")
+    if batch.status != "completed":
+        return None
+    
+    results = {}
+    if not batch.output_file_id:
+        return results
+    
+    output = await client.files.content(batch.output_file_id)
+    for line in output.content.splitlines():
+        if not line:
+            continue
+        try:
+            item = orjson.loads(line)
+            response = item.get("response") or {}
+            if item.get("error") or response.get("status_code") != 200:
+                logger.error("Batch item failed", extra={"custom_id": item.get("custom_id"), "error": item.get("error")})
+                continue
+            parsed = _decode_valid_parse(response["body"]["choices"][0]["message"]["content"])
+            if parsed is None:
+                logger.error("Batch item has an invalid parse", extra={"custom_id": item.get("custom_id")})
+                continue
+            results[item["custom_id"]] = parsed
+        except (orjson.JSONDecodeError, KeyError, IndexError, TypeError, AttributeError) as e:
+            # One truncated line or non-JSON reply must not cost the rest of the batch
+            logger.error("Unreadable batch item", extra={"line": line[:200].decode("utf-8", errors="replace"), "error": str(e)})
+            continue
+    
+    logger.info("Collected feedback batch", extra={"batch_id": batch_id, "parsed": len(results)})
+    return results
+
+async def apply_feedback_batches(db: AsyncSession) -> int:
+    """
+    Store the results of every finished batch on the feedback queued in it
+    
+    Polled by the poll_feedback_batches Celery beat task; batches still
+    running are left alone, and feedback from failed batches is released
+    so it can be queued again
+    
+    Args:
+        db: Session to read and update feedback with
+        
+    Returns:
+        Number of feedback rows that received a parse
+    """
+    batch_ids = (await db.execute(
+        select(Feedback.batch_id).where(Feedback.batch_id.is_not(None)).distinct()
+    )).scalars().all()
+    
+    applied = 0
+    for batch_id in batch_ids:
+        try:
+            results = await collect_feedback_batch(batch_id)
+        except RuntimeError as e:
+            logger.error(str(e), extra={"batch_id": batch_id})
+            await db.execute(update(Feedback).where(Feedback.batch_id == batch_id).values(batch_id=None))
+            await db.commit()
+            continue
+        if results is None:
+            continue
+        
+        feedbacks = (await db.execute(
+            select(Feedback).where(Feedback.batch_id == batch_id)
+        )).scalars().all()
+        for feedback in feedbacks:
+            parsed = results.get(str(feedback.id))
+            if parsed is not None:
+                feedback.summary = parsed
+                feedback.sentiment = get_sentiment(parsed)
+                feedback.priority = get_priority(parsed)
+                db.add_all(
+                    ActionItem(feedback_id=feedback.id, description=item["description"], priority=_action_priority(item))
+                    for item in extract_action_items(parsed)
+                )
+                applied += 1
+            # Items missing from the output failed; clearing the id lets them be queued again
+            feedback.batch_id = None
+        await db.commit()
+    
+    return applied
+
+def _action_priority(action_item: Dict[str, Any]) -> int:
+    """Action item priority as stored (0=low .. 3=urgent), low if missing or out of range"""
+    priority = action_item.get("priority")
+    if isinstance(priority, int) and not isinstance(priority, bool) and 0 <= priority <= 3:
+        return priority
+    return 0
+
 def extract_action_items(parsed_feedback: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Extract action items from parsed feedback"""
     return parsed_feedback.get("action_items", [])
@@ -0,0 +1,68 @@
+"""
+Storage Service
+Streams uploaded files into the configured upload directory
+"""
+import os
+import uuid
+from typing import Tuple
+from fastapi import HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.logging_config import logger
+
+CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+async def stream_to_storage(file: UploadFile, prefix: str) -> Tuple[str, int]:
+    """
+    Copy an upload to storage one chunk at a time
+
+    Args:
+        file: Uploaded file
+        prefix: Key prefix grouping related files, e.g. a feedback id
+
+    Returns:
+        Storage key and number of bytes written
+
+    Raises:
+        HTTPException: If the file exceeds the maximum upload size
+    """
+    extension = os.path.splitext(file.filename or "")[1].lower()
+    key = f"{prefix}/{uuid.uuid4().hex}{extension}"
+    path = os.path.join(settings.UPLOAD_DIR, key)
+
+    await run_in_threadpool(os.makedirs, os.path.dirname(path), exist_ok=True)
+    out = await run_in_threadpool(open, path, "wb")
+    total = 0
+    try:
+        while chunk := await file.read(CHUNK_SIZE):
+            total += len(chunk)
+            if total > settings.max_upload_size_bytes:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"File exceeds the {settings.MAX_UPLOAD_SIZE_MB} MB upload limit"
+                )
+            await run_in_threadpool(out.write, chunk)
+    except BaseException:
+        await run_in_threadpool(out.close)
+        await run_in_threadpool(os.remove, path)
+        raise
+
+    await run_in_threadpool(out.close)
+    logger.info("Stored upload", extra={"key": key, "size": total})
+    return key, total
+
+
+async def delete_from_storage(key: str) -> None:
+    """
+    Remove a stored file, e.g. one whose database row was never created
+
+    Args:
+        key: Storage key returned by stream_to_storage
+    """
+    try:
+        await run_in_threadpool(os.remove, os.path.join(settings.UPLOAD_DIR, key))
+    except OSError as e:
+        logger.warning("Could not delete upload", extra={"key": key, "error": str(e)})
+        return
+    logger.info("Deleted upload", extra={"key": key})
@@ -0,0 +1 @@
+"""Background tasks run by the Celery worker and beat"""
@@ -0,0 +1,64 @@
+"""
+Celery Application
+Worker and beat entry point (celery -A app.tasks.celery_app), with the
+periodic poll that applies finished OpenAI feedback batches
+"""
+
+import asyncio
+from typing import Optional
+
+from celery import Celery
+
+from app.core.config import settings
+from app.core.logging_config import logger
+from app.db.session import AsyncSessionLocal
+from app.services.ai_service import apply_feedback_batches
+
+celery_app = Celery(
+    "freelancer_feedback",
+    broker=settings.CELERY_BROKER_URL,
+    backend=settings.CELERY_RESULT_BACKEND,
+)
+celery_app.conf.update(
+    task_serializer=settings.CELERY_TASK_SERIALIZER,
+    result_serializer=settings.CELERY_RESULT_SERIALIZER,
+    accept_content=settings.CELERY_ACCEPT_CONTENT,
+    timezone=settings.CELERY_TIMEZONE,
+    enable_utc=settings.CELERY_ENABLE_UTC,
+    task_track_started=settings.CELERY_TASK_TRACK_STARTED,
+    task_time_limit=settings.CELERY_TASK_TIME_LIMIT,
+    task_soft_time_limit=settings.CELERY_TASK_SOFT_TIME_LIMIT,
+    beat_schedule={
+        "poll-feedback-batches": {
+            "task": "app.tasks.celery_app.poll_feedback_batches",
+            "schedule": settings.FEEDBACK_BATCH_POLL_SECONDS,
+        },
+    },
+)
+
+# One loop per worker process: the database pool, Redis cache and OpenAI
+# client keep connections bound to the loop they were opened on
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _run(coro):
+    """Run coro on this worker process's event loop"""
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+    return _loop.run_until_complete(coro)
+
+
+async def _apply_feedback_batches() -> int:
+    """apply_feedback_batches with a session of its own"""
+    async with AsyncSessionLocal() as db:
+        return await apply_feedback_batches(db)
+
+
+@celery_app.task(name="app.tasks.celery_app.poll_feedback_batches")
+def poll_feedback_batches() -> int:
+    """Store the results of finished feedback batches; returns the feedback count applied"""
+    applied = _run(_apply_feedback_batches())
+    if applied:
+        logger.info("Applied feedback batches", extra={"applied": applied})
+    return applied
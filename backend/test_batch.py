@@ -0,0 +1,53 @@
+"""Test that the batch endpoint refuses to run nested batches"""
+import asyncio
+import os
+import sys
+
+# Set minimal environment variables
+os.environ.setdefault('DATABASE_URL', 'sqlite:///./test.db')
+os.environ.setdefault('SECRET_KEY', 'test-secret-key-min-32-characters-long')
+os.environ.setdefault('ENVIRONMENT', 'testing')
+
+import httpx
+
+from app.api.v1.endpoints.batch import _mark_in_batch
+from app.main import app
+
+BATCH_URL = "http://testserver/api/v1/batch"
+
+
+async def post_batch(operations: list, transport_app=app) -> httpx.Response:
+    """POST operations to /batch through the app in-process"""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=transport_app)) as client:
+        return await client.post(BATCH_URL, json=operations)
+
+
+def test_dot_segment_paths_are_rejected():
+    """Paths that only resolve to /batch after normalisation are still nested batches"""
+    for path in ("/./batch", "/projects/../batch"):
+        response = asyncio.run(post_batch([{"id": "inner", "method": "POST", "path": path, "body": []}]))
+        assert response.status_code == 400, f"{path} returned {response.status_code}"
+        assert response.json()["detail"] == "Batches cannot be nested"
+
+
+def test_batch_refuses_to_run_inside_a_batch():
+    """A request flagged as a batch sub-request cannot start another batch"""
+    response = asyncio.run(post_batch([], transport_app=_mark_in_batch(app)))
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Batches cannot be nested"
+
+
+if __name__ == "__main__":
+    tests = [
+        test_dot_segment_paths_are_rejected,
+        test_batch_refuses_to_run_inside_a_batch,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,87 @@
+"""Test that rate limits are keyed per client behind the nginx proxy"""
+import os
+import sys
+from ipaddress import ip_network
+
+# Set minimal environment variables
+os.environ.setdefault('DATABASE_URL', 'sqlite:///./test.db')
+os.environ.setdefault('SECRET_KEY', 'test-secret-key-min-32-characters-long')
+os.environ.setdefault('ENVIRONMENT', 'testing')
+
+from limits import parse
+from limits.storage import MemoryStorage
+from limits.strategies import FixedWindowRateLimiter
+from starlette.requests import Request
+
+from app.core import rate_limit
+from app.core.rate_limit import REGISTER_RATE_LIMIT, auth_rate_limit_key, client_ip
+
+# Matches the pinned nginx address and TRUSTED_PROXIES in docker-compose.yml
+NGINX_IP = "172.28.0.10"
+DOCKER_GATEWAY_IP = "172.28.0.1"
+rate_limit.TRUSTED_PROXY_NETWORKS = (ip_network(NGINX_IP),)
+
+
+def make_request(peer: str, headers: dict) -> Request:
+    """A bare request from peer carrying the given headers"""
+    return Request({
+        "type": "http",
+        "method": "POST",
+        "path": "/api/v1/auth/register",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+        "client": (peer, 50000),
+    })
+
+
+def test_forwarded_ips_get_separate_buckets():
+    """Two clients behind nginx must not share a register bucket"""
+    first = client_ip(make_request(NGINX_IP, {"X-Real-IP": "203.0.113.7"}))
+    second = client_ip(make_request(NGINX_IP, {"X-Forwarded-For": "198.51.100.1, 198.51.100.23"}))
+    assert (first, second) == ("203.0.113.7", "198.51.100.23")
+
+    limit = parse(REGISTER_RATE_LIMIT)
+    buckets = FixedWindowRateLimiter(MemoryStorage())
+    while buckets.hit(limit, first):
+        pass
+    assert not buckets.test(limit, first), "first client should be limited"
+    assert buckets.test(limit, second), "second client should have its own bucket"
+
+
+def test_login_key_uses_forwarded_ip():
+    """The per-email login key is also per client, not per proxy"""
+    first = make_request(NGINX_IP, {"X-Real-IP": "203.0.113.7"})
+    second = make_request(NGINX_IP, {"X-Real-IP": "203.0.113.8"})
+    for request in (first, second):
+        request._json = {"email": "User@Example.com"}
+    assert auth_rate_limit_key(first) == "203.0.113.7:user@example.com"
+    assert auth_rate_limit_key(first) != auth_rate_limit_key(second)
+
+
+def test_untrusted_peer_cannot_spoof_headers():
+    """Forwarding headers from anyone but the proxy are ignored"""
+    request = make_request("203.0.113.50", {"X-Real-IP": "10.0.0.1", "X-Forwarded-For": "10.0.0.2"})
+    assert client_ip(request) == "203.0.113.50"
+
+
+def test_gateway_is_not_trusted():
+    """Direct hits on the published port arrive from the gateway and cannot forge headers"""
+    request = make_request(DOCKER_GATEWAY_IP, {"X-Real-IP": "203.0.113.99"})
+    assert client_ip(request) == DOCKER_GATEWAY_IP
+
+
+if __name__ == "__main__":
+    tests = [
+        test_forwarded_ips_get_separate_buckets,
+        test_login_key_uses_forwarded_ip,
+        test_untrusted_peer_cannot_spoof_headers,
+        test_gateway_is_not_trusted,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -1,6 +1,8 @@
-import React, { createContext, useContext, useState, useEffect } from 'react';
+import React, { createContext, useCallback, useContext, useEffect, useMemo, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import * as authService from '../services/auth';
+import { refreshAccessToken } from '../services/api';
+import { setAccessToken } from '../services/tokenStore';
 
 interface User {
   id: string;
@@ -8,15 +10,32 @@ interface User {
   full_name?: string;
 }
 
-interface AuthContextType {
+interface AuthState {
   user: User | null;
+  isLoading: boolean;
+}
+
+interface AuthDispatch {
   login: (email: string, password: string) => Promise<void>;
   register: (email: string, password: string, fullName?: string) => Promise<void>;
   logout: () => void;
-  isLoading: boolean;
 }
 
-const AuthContext = createContext<AuthContextType | undefined>(undefined);
+type AuthContextType = AuthState & AuthDispatch;
+
+// Split so components that only call login/register/logout don't re-render on user changes
+const AuthStateContext = createContext<AuthState | undefined>(undefined);
+const AuthDispatchContext = createContext<AuthDispatch | undefined>(undefined);
+
+const shallowEqual = <T extends object>(a: T, b: T): boolean => {
+  const keys = Object.keys(a) as (keyof T)[];
+  return keys.length === Object.keys(b).length && keys.every((key) => a[key] === b[key]);
+};
+
+// State updater that keeps the current user object when the fetched one has the
+// same fields, so a re-fetch doesn't re-render every state consumer
+const keepIfUnchanged = (next: User | null) => (prev: User | null): User | null =>
+  prev && next && shallowEqual(prev, next) ? prev : next;
 
 export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children }) => {
   const [user, setUser] = useState<User | null>(null);
@@ -24,49 +43,62 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children
   const navigate = useNavigate();
 
   useEffect(() => {
-    const token = localStorage.getItem('access_token');
-    if (token) {
-      authService.getCurrentUser()
-        .then(setUser)
-        .catch(() => localStorage.removeItem('access_token'))
-        .finally(() => setIsLoading(false));
-    } else {
-      setIsLoading(false);
-    }
+    // Restore the session from the refresh cookie
+    refreshAccessToken()
+      .then(() => authService.getCurrentUser())
+      .then((userData) => setUser(keepIfUnchanged(userData)))
+      .catch(() => setAccessToken(null))
+      .finally(() => setIsLoading(false));
   }, []);
 
-  const login = async (email: string, password: string) => {
+  const login = useCallback(async (email: string, password: string) => {
     const response = await authService.login(email, password);
-    localStorage.setItem('access_token', response.access_token);
-    localStorage.setItem('refresh_token', response.refresh_token);
+    setAccessToken(response.access_token);
     const userData = await authService.getCurrentUser();
-    setUser(userData);
+    setUser(keepIfUnchanged(userData));
     navigate('/');
-  };
+  }, [navigate]);
 
-  const register = async (email: string, password: string, fullName?: string) => {
+  const register = useCallback(async (email: string, password: string, fullName?: string) => {
     await authService.register(email, password, fullName);
     await login(email, password);
-  };
+  }, [login]);
 
-  const logout = () => {
-    localStorage.removeItem('access_token');
-    localStorage.removeItem('refresh_token');
+  const logout = useCallback(() => {
+    // Clears the refresh cookie server-side; failures still log out locally
+    authService.logout().catch(() => undefined);
+    setAccessToken(null);
     setUser(null);
     navigate('/login');
-  };
+  }, [navigate]);
+
+  // Stable values so consumers only re-render when what they read changes
+  const state = useMemo(() => ({ user, isLoading }), [user, isLoading]);
+  const dispatch = useMemo(() => ({ login, register, logout }), [login, register, logout]);
 
   return (
-    <AuthContext.Provider value={{ user, login, register, logout, isLoading }}>
-      {children}
-    </AuthContext.Provider>
+    <AuthDispatchContext.Provider value={dispatch}>
+      <AuthStateContext.Provider value={state}>
+        {children}
+      </AuthStateContext.Provider>
+    </AuthDispatchContext.Provider>
   );
 };
 
-export const useAuth = () => {
-  const context = useContext(AuthContext);
+export const useAuthState = () => {
+  const context = useContext(AuthStateContext);
   if (!context) {
-    throw new Error('useAuth must be used within AuthProvider');
+    throw new Error('useAuthState must be used within AuthProvider');
   }
   return context;
 };
+
+export const useAuthDispatch = () => {
+  const context = useContext(AuthDispatchContext);
+  if (!context) {
+    throw new Error('useAuthDispatch must be used within AuthProvider');
+  }
+  return context;
+};
+
+export const useAuth = (): AuthContextType => ({ ...useAuthState(), ...useAuthDispatch() });
@@ -1,8 +1,9 @@
 import React from 'react';
-import { useAuth } from '../contexts/AuthContext';
+import { useAuthDispatch, useAuthState } from '../contexts/AuthContext';
 
 const Dashboard: React.FC = () => {
-  const { user, logout } = useAuth();
+  const { user } = useAuthState();
+  const { logout } = useAuthDispatch();
 
   return (
     <div className="min-h-screen bg-gray-50">
@@ -41,4 +42,4 @@ const Dashboard: React.FC = () => {
   );
 };
 
-export default Dashboard;
+export default React.memo(Dashboard);
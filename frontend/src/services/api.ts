@@ -1,28 +1,87 @@
-import axios from 'axios';
+import axios, { AxiosError, InternalAxiosRequestConfig } from 'axios';
+import { getAccessToken, setAccessToken } from './tokenStore';
 
-const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
+// Empty VITE_API_URL means same origin, e.g. behind the HTTP/2 nginx proxy
+const API_URL = import.meta.env.VITE_API_URL ?? 'http://localhost:8000';
 
 const api = axios.create({
   baseURL: `${API_URL}/api/v1`,
   headers: {
     'Content-Type': 'application/json',
   },
+  // Send the httpOnly refresh cookie to the auth routes
+  withCredentials: true,
 });
 
 api.interceptors.request.use((config) => {
-  const token = localStorage.getItem('access_token');
+  const token = getAccessToken();
   if (token) {
     config.headers.Authorization = `Bearer ${token}`;
   }
   return config;
 });
 
+// One refresh at a time; concurrent 401s all wait on the same request
+let refreshPromise: Promise<string> | null = null;
+
+export const refreshAccessToken = (): Promise<string> => {
+  if (!refreshPromise) {
+    refreshPromise = api
+      .post('/auth/refresh')
+      .then((response) => {
+        setAccessToken(response.data.access_token);
+        return response.data.access_token as string;
+      })
+      .finally(() => {
+        refreshPromise = null;
+      });
+  }
+  return refreshPromise;
+};
+
+const AUTH_ROUTES = ['/auth/login', '/auth/refresh'];
+
+// 429s are retried with exponential backoff, honouring Retry-After; longer
+// waits (e.g. a locked-out login) are surfaced to the caller instead
+const MAX_RATE_LIMIT_RETRIES = 3;
+const BASE_RETRY_DELAY_MS = 500;
+const MAX_RETRY_DELAY_MS = 10000;
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
 api.interceptors.response.use(
   (response) => response,
-  async (error) => {
-    if (error.response?.status === 401) {
-      localStorage.removeItem('access_token');
-      window.location.href = '/login';
+  async (error: AxiosError) => {
+    const original = error.config as
+      | (InternalAxiosRequestConfig & { _retry?: boolean; _rateLimitRetries?: number })
+      | undefined;
+    if (error.response?.status === 429 && original) {
+      const attempt = original._rateLimitRetries ?? 0;
+      const retryAfter = Number(error.response.headers['retry-after']);
+      const delay = Number.isFinite(retryAfter) && retryAfter > 0
+        ? retryAfter * 1000
+        : BASE_RETRY_DELAY_MS * 2 ** attempt;
+      if (attempt < MAX_RATE_LIMIT_RETRIES && delay <= MAX_RETRY_DELAY_MS) {
+        original._rateLimitRetries = attempt + 1;
+        await sleep(delay);
+        return api(original);
+      }
+      return Promise.reject(error);
+    }
+    if (
+      error.response?.status === 401 &&
+      original &&
+      !original._retry &&
+      !AUTH_ROUTES.includes(original.url ?? '')
+    ) {
+      original._retry = true;
+      try {
+        await refreshAccessToken();
+        return api(original);
+      } catch {
+        setAccessToken(null);
+        window.location.href = '/login';
+      }
     }
     return Promise.reject(error);
   }
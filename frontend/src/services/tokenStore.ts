@@ -0,0 +1,8 @@
+// Access token lives only in memory; the refresh token is an httpOnly cookie
+let accessToken: string | null = null;
+
+export const getAccessToken = (): string | null => accessToken;
+
+export const setAccessToken = (token: string | null): void => {
+  accessToken = token;
+};
@@ -4,14 +4,56 @@ Comprehensive Frontend UI Testing Script
 Tests all pages, forms, navigation, and user workflows
 """
 
+import socket
+import sys
 import time
+import orjson
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+try:
+    import ijson
+except ImportError:  # Optional: list counts fall back to decoding the whole body
+    ijson = None
+
+# TCP keep-alive probing so a dead peer is detected in ~3s instead of
+# waiting out each request's full timeout
+KEEPALIVE_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+for _opt, _value in (("TCP_KEEPIDLE", 1), ("TCP_KEEPINTVL", 1), ("TCP_KEEPCNT", 3), ("TCP_USER_TIMEOUT", 3000)):
+    if hasattr(socket, _opt):  # Linux-only options
+        KEEPALIVE_SOCKET_OPTIONS.append((socket.IPPROTO_TCP, getattr(socket, _opt), _value))
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that applies KEEPALIVE_SOCKET_OPTIONS to pooled connections"""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = KEEPALIVE_SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
 
 class FrontendUITester:
-    def __init__(self):
+    __slots__ = (
+        "use_batch", "frontend_url", "_localhost_ip", "backend_url",
+        "test_email", "test_password", "test_name",
+        "passed", "failed", "warnings",
+        "url_health", "url_register", "url_login", "url_me",
+        "url_projects", "url_feedback", "url_revisions", "url_batch",
+        "url_project_feedback", "url_feedback_revisions",
+        "session", "_register_body", "_login_body", "_project_body", "_buf",
+        "access_token", "project_id", "feedback_id", "revision_id",
+    )
+    
+    def __init__(self, use_batch=True):
+        self.use_batch = use_batch
         self.frontend_url = "http://localhost:5173"
-        self.backend_url = "http://localhost:8000"
+        # Resolve localhost once so API calls skip the per-connection lookup
+        self._localhost_ip = socket.gethostbyname("localhost")
+        self.backend_url = f"http://{self._localhost_ip}:8000"
         self.test_email = f"ui_test_{int(time.time())}@example.com"
         self.test_password = "TestPassword123!"
         self.test_name = "UI Test User"
@@ -19,40 +61,91 @@ class FrontendUITester:
         self.failed = 0
         self.warnings = 0
         
+        # API URLs, formatted once
+        api_url = f"{self.backend_url}/api/v1"
+        self.url_health = f"{self.backend_url}/health"
+        self.url_register = f"{api_url}/auth/register"
+        self.url_login = f"{api_url}/auth/login"
+        self.url_me = f"{api_url}/auth/me"
+        self.url_projects = f"{api_url}/projects/"
+        self.url_feedback = f"{api_url}/feedback/"
+        self.url_revisions = f"{api_url}/revisions/"
+        self.url_batch = f"{api_url}/batch"
+        
+        # Shared session: pooled keep-alive connections + retry on transient errors
+        retry = Retry(
+            total=3,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST", "OPTIONS", "HEAD"]),
+        )
+        adapter = KeepAliveAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Content-Type"] = "application/json"
+        
+        # Fixed request bodies, serialized once
+        self._register_body = orjson.dumps({
+            "email": self.test_email,
+            "password": self.test_password,
+            "full_name": self.test_name
+        })
+        self._login_body = orjson.dumps({
+            "email": self.test_email,
+            "password": self.test_password
+        })
+        self._project_body = orjson.dumps({
+            "name": "UI Test Project",
+            "description": "Project created during UI testing",
+            "status": "active"
+        })
+        
+        # Per-test output, written with a single write in flush_output()
+        self._buf = []
+        
     def print_header(self, text):
         print("\n" + "=" * 70)
         print(f"{text:^70}")
         print("=" * 70 + "\n")
     
     def print_section(self, text):
-        print("\n" + "─" * 70)
-        print(text)
-        print("─" * 70)
+        self._buf.append("\n" + "─" * 70)
+        self._buf.append(text)
+        self._buf.append("─" * 70)
     
     def print_result(self, test_name, passed, details=""):
         symbol = "✓" if passed else "✗"
-        status = "PASS" if passed else "FAIL"
-        print(f"{symbol} {test_name}")
+        self._buf.append(f"{symbol} {test_name}")
         if details:
-            print(f"  {details}")
+            self._buf.append(f"  {details}")
         if passed:
             self.passed += 1
         else:
             self.failed += 1
     
+    def flush_output(self):
+        """Write buffered section/result lines to stdout in one call"""
+        if self._buf:
+            sys.stdout.write("\n".join(self._buf) + "\n")
+            sys.stdout.flush()
+            self._buf.clear()
+    
     def check_server(self, url, name):
         """Check if server is running"""
         try:
-            response = requests.get(url, timeout=5)
+            response = self.session.get(url, timeout=5)
             return response.status_code == 200
-        except:
+        except (requests.ConnectionError, requests.Timeout, requests.HTTPError,
+                requests.exceptions.RetryError) as e:
+            self._buf.append(f"  {name} unreachable: {e}")
             return False
     
     def test_frontend_loads(self):
         """Test if frontend loads without errors"""
         self.print_section("1. Frontend Loading Test")
         try:
-            response = requests.get(self.frontend_url, timeout=10)
+            response = self.session.get(self.frontend_url, timeout=10)
             if response.status_code == 200:
                 self.print_result("Frontend loads successfully", True, 
                                 f"Status: {response.status_code}")
@@ -71,14 +164,13 @@ class FrontendUITester:
         
         endpoints = [
             ("/health", "Health Check"),
-            ("/docs", "API Documentation"),
             ("/openapi.json", "OpenAPI Schema"),
         ]
         
         all_passed = True
         for endpoint, name in endpoints:
             try:
-                response = requests.get(f"{self.backend_url}{endpoint}", timeout=5)
+                response = self.session.get(f"{self.backend_url}{endpoint}", timeout=5)
                 passed = response.status_code == 200
                 self.print_result(f"{name} accessible", passed, 
                                 f"Status: {response.status_code}")
@@ -95,8 +187,8 @@ class FrontendUITester:
         self.print_section("3. CORS Configuration Test")
         
         try:
-            response = requests.options(
-                f"{self.backend_url}/api/v1/auth/login",
+            response = self.session.options(
+                self.url_login,
                 headers={
                     "Origin": self.frontend_url,
                     "Access-Control-Request-Method": "POST",
@@ -124,24 +216,20 @@ class FrontendUITester:
         self.print_section("4. Registration API Test (Frontend Simulation)")
         
         try:
-            response = requests.post(
-                f"{self.backend_url}/api/v1/auth/register",
-                json={
-                    "email": self.test_email,
-                    "password": self.test_password,
-                    "full_name": self.test_name
-                },
+            response = self.session.post(
+                self.url_register,
+                data=self._register_body,
                 timeout=10
             )
             
             if response.status_code == 201:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.print_result("User registration", True, 
                                 f"User ID: {data.get('id')}, Email: {data.get('email')}")
                 return True
             else:
                 self.print_result("User registration", False, 
-                                f"Status: {response.status_code}, Response: {response.text}")
+                                f"Status: {response.status_code}, Response: {response.content[:200].decode('utf-8', 'replace')}")
                 return False
         except Exception as e:
             self.print_result("User registration", False, f"Error: {str(e)}")
@@ -152,24 +240,21 @@ class FrontendUITester:
         self.print_section("5. Login API Test (Frontend Simulation)")
         
         try:
-            response = requests.post(
-                f"{self.backend_url}/api/v1/auth/login",
-                json={
-                    "email": self.test_email,
-                    "password": self.test_password
-                },
+            response = self.session.post(
+                self.url_login,
+                data=self._login_body,
                 timeout=10
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.access_token = data.get("access_token")
                 self.print_result("User login", True, 
                                 f"Token received (length: {len(self.access_token)})")
                 return True
             else:
                 self.print_result("User login", False, 
-                                f"Status: {response.status_code}, Response: {response.text}")
+                                f"Status: {response.status_code}, Response: {response.content[:200].decode('utf-8', 'replace')}")
                 return False
         except Exception as e:
             self.print_result("User login", False, f"Error: {str(e)}")
@@ -184,14 +269,14 @@ class FrontendUITester:
             return False
         
         try:
-            response = requests.get(
-                f"{self.backend_url}/api/v1/auth/me",
+            response = self.session.get(
+                self.url_me,
                 headers={"Authorization": f"Bearer {self.access_token}"},
                 timeout=5
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.print_result("Get current user", True, 
                                 f"Email: {data.get('email')}, Active: {data.get('is_active')}")
                 return True
@@ -212,26 +297,23 @@ class FrontendUITester:
             return False
         
         try:
-            response = requests.post(
-                f"{self.backend_url}/api/v1/projects/",
-                json={
-                    "name": "UI Test Project",
-                    "description": "Project created during UI testing",
-                    "status": "active"
-                },
+            response = self.session.post(
+                self.url_projects,
+                data=self._project_body,
                 headers={"Authorization": f"Bearer {self.access_token}"},
                 timeout=10
             )
             
             if response.status_code == 201:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.project_id = data.get('id')
+                self.url_project_feedback = f"{self.url_projects}{self.project_id}/feedback"
                 self.print_result("Create project", True, 
                                 f"Project ID: {self.project_id}, Name: {data.get('name')}")
                 return True
             else:
                 self.print_result("Create project", False, 
-                                f"Status: {response.status_code}, Response: {response.text}")
+                                f"Status: {response.status_code}, Response: {response.content[:200].decode('utf-8', 'replace')}")
                 return False
         except Exception as e:
             self.print_result("Create project", False, f"Error: {str(e)}")
@@ -246,26 +328,27 @@ class FrontendUITester:
             return False
         
         try:
-            response = requests.post(
-                f"{self.backend_url}/api/v1/feedback/",
-                json={
+            response = self.session.post(
+                self.url_feedback,
+                data=orjson.dumps({
                     "project_id": self.project_id,
                     "raw_text": "Make it pop and add more energy to the design. The colors need to be more vibrant.",
                     "status": "pending"
-                },
+                }),
                 headers={"Authorization": f"Bearer {self.access_token}"},
                 timeout=10
             )
             
             if response.status_code == 201:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.feedback_id = data.get('id')
+                self.url_feedback_revisions = f"{self.url_feedback}{self.feedback_id}/revisions"
                 self.print_result("Submit feedback", True, 
                                 f"Feedback ID: {self.feedback_id}")
                 return True
             else:
                 self.print_result("Submit feedback", False, 
-                                f"Status: {response.status_code}, Response: {response.text}")
+                                f"Status: {response.status_code}, Response: {response.content[:200].decode('utf-8', 'replace')}")
                 return False
         except Exception as e:
             self.print_result("Submit feedback", False, f"Error: {str(e)}")
@@ -280,8 +363,8 @@ class FrontendUITester:
             return False
         
         try:
-            response = requests.post(
-                f"{self.backend_url}/api/v1/revisions/",
+            response = self.session.post(
+                self.url_revisions,
                 params={
                     "feedback_id": self.feedback_id,
                     "notes": "First revision addressing the feedback"
@@ -291,19 +374,94 @@ class FrontendUITester:
             )
             
             if response.status_code == 201:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.revision_id = data.get('id')
                 self.print_result("Upload revision", True, 
                                 f"Revision ID: {self.revision_id}, Version: {data.get('version')}")
                 return True
             else:
                 self.print_result("Upload revision", False, 
-                                f"Status: {response.status_code}, Response: {response.text}")
+                                f"Status: {response.status_code}, Response: {response.content[:200].decode('utf-8', 'replace')}")
                 return False
         except Exception as e:
             self.print_result("Upload revision", False, f"Error: {str(e)}")
             return False
     
+    def test_creation_batch(self):
+        """Test project, feedback and revision creation as one batch request"""
+        self.print_section("7-9. Project/Feedback/Revision Batch Creation Test")
+        
+        if not hasattr(self, 'access_token'):
+            self.print_result("Batch creation", False, "No access token available")
+            return False
+        
+        operations = [
+            {"id": "p", "method": "POST", "path": "/projects/",
+             "body": orjson.loads(self._project_body)},
+            {"id": "f", "method": "POST", "path": "/feedback/",
+             "body": {
+                 "project_id": "${p.id}",
+                 "raw_text": "Make it pop and add more energy to the design. The colors need to be more vibrant.",
+                 "status": "pending"
+             }},
+            {"id": "r", "method": "POST", "path": "/revisions/",
+             "params": {
+                 "feedback_id": "${f.id}",
+                 "notes": "First revision addressing the feedback"
+             }},
+        ]
+        
+        try:
+            response = self.session.post(
+                self.url_batch,
+                data=orjson.dumps(operations),
+                headers={"Authorization": f"Bearer {self.access_token}"},
+                timeout=30
+            )
+            
+            if response.status_code != 200:
+                self.print_result("Batch creation", False, 
+                                f"Status: {response.status_code}, Response: {response.content[:200].decode('utf-8', 'replace')}")
+                return False
+            
+            results = {item["id"]: item for item in orjson.loads(response.content)}
+            project, feedback, revision = results["p"], results["f"], results["r"]
+            
+            if project["status"] == 201:
+                self.project_id = project["body"].get('id')
+                self.url_project_feedback = f"{self.url_projects}{self.project_id}/feedback"
+                self.print_result("Create project", True, 
+                                f"Project ID: {self.project_id}, Name: {project['body'].get('name')}")
+            else:
+                self.print_result("Create project", False, f"Status: {project['status']}")
+            
+            if feedback["status"] == 201:
+                self.feedback_id = feedback["body"].get('id')
+                self.url_feedback_revisions = f"{self.url_feedback}{self.feedback_id}/revisions"
+                self.print_result("Submit feedback", True, 
+                                f"Feedback ID: {self.feedback_id}")
+            else:
+                self.print_result("Submit feedback", False, f"Status: {feedback['status']}")
+            
+            if revision["status"] == 201:
+                self.revision_id = revision["body"].get('id')
+                self.print_result("Upload revision", True, 
+                                f"Revision ID: {self.revision_id}, Version: {revision['body'].get('version')}")
+            else:
+                self.print_result("Upload revision", False, f"Status: {revision['status']}")
+            
+            return all(item["status"] == 201 for item in (project, feedback, revision))
+        except Exception as e:
+            self.print_result("Batch creation", False, f"Error: {str(e)}")
+            return False
+    
+    def _count_items(self, response):
+        """Count the items of a streamed JSON array without building the list"""
+        if ijson is None:
+            return len(orjson.loads(response.content))
+        response.raw.decode_content = True  # Undo GZip transparently
+        return sum(1 for _ in ijson.items(response.raw, "item"))
+    
     def test_data_retrieval(self):
         """Test data retrieval (simulating frontend data loading)"""
         self.print_section("10. Data Retrieval Test")
@@ -313,16 +471,19 @@ class FrontendUITester:
             return False
         
         all_passed = True
+        get = self.session.get
         
         # Test projects list
         try:
-            response = requests.get(
-                f"{self.backend_url}/api/v1/projects/",
+            response = get(
+                self.url_projects,
                 headers={"Authorization": f"Bearer {self.access_token}"},
-                timeout=5
+                timeout=5,
+                stream=True
             )
             passed = response.status_code == 200
-            count = len(response.json()) if passed else 0
+            count = self._count_items(response) if passed else 0
+            response.close()
             self.print_result("List projects", passed, f"Found {count} project(s)")
             if not passed:
                 all_passed = False
@@ -333,13 +494,15 @@ class FrontendUITester:
         # Test feedback list
         if hasattr(self, 'project_id'):
             try:
-                response = requests.get(
-                    f"{self.backend_url}/api/v1/projects/{self.project_id}/feedback",
+                response = get(
+                    self.url_project_feedback,
                     headers={"Authorization": f"Bearer {self.access_token}"},
-                    timeout=5
+                    timeout=5,
+                    stream=True
                 )
                 passed = response.status_code == 200
-                count = len(response.json()) if passed else 0
+                count = self._count_items(response) if passed else 0
+                response.close()
                 self.print_result("List feedback", passed, f"Found {count} feedback item(s)")
                 if not passed:
                     all_passed = False
@@ -350,13 +513,15 @@ class FrontendUITester:
         # Test revisions list
         if hasattr(self, 'feedback_id'):
             try:
-                response = requests.get(
-                    f"{self.backend_url}/api/v1/feedback/{self.feedback_id}/revisions",
+                response = get(
+                    self.url_feedback_revisions,
                     headers={"Authorization": f"Bearer {self.access_token}"},
-                    timeout=5
+                    timeout=5,
+                    stream=True
                 )
                 passed = response.status_code == 200
-                count = len(response.json()) if passed else 0
+                count = self._count_items(response) if passed else 0
+                response.close()
                 self.print_result("List revisions", passed, f"Found {count} revision(s)")
                 if not passed:
                     all_passed = False
@@ -377,12 +542,13 @@ class FrontendUITester:
         # Check servers are running
         self.print_section("Pre-flight Checks")
         frontend_running = self.check_server(self.frontend_url, "Frontend")
-        backend_running = self.check_server(f"{self.backend_url}/health", "Backend")
+        backend_running = self.check_server(self.url_health, "Backend")
         
         self.print_result("Frontend server running", frontend_running, 
                          f"URL: {self.frontend_url}")
         self.print_result("Backend server running", backend_running, 
                          f"URL: {self.backend_url}")
+        self.flush_output()
         
         if not frontend_running or not backend_running:
             print("\n❌ Servers not running. Please start both servers:")
@@ -391,16 +557,23 @@ class FrontendUITester:
             return
         
         # Run tests
-        self.test_frontend_loads()
-        self.test_api_endpoints_accessible()
-        self.test_cors_configuration()
-        self.test_registration_api()
-        self.test_login_api()
-        self.test_authenticated_request()
-        self.test_project_creation()
-        self.test_feedback_submission()
-        self.test_revision_upload()
-        self.test_data_retrieval()
+        tests = [
+            self.test_frontend_loads,
+            self.test_api_endpoints_accessible,
+            self.test_cors_configuration,
+            self.test_registration_api,
+            self.test_login_api,
+            self.test_authenticated_request,
+        ]
+        if self.use_batch:
+            tests.append(self.test_creation_batch)
+        else:
+            tests += [self.test_project_creation, self.test_feedback_submission, self.test_revision_upload]
+        tests.append(self.test_data_retrieval)
+        
+        for test in tests:
+            test()
+            self.flush_output()
         
         # Summary
         self.print_header("Test Summary")
@@ -431,5 +604,6 @@ class FrontendUITester:
         print(f"📚 API Docs: {self.backend_url}/docs")
 
 if __name__ == "__main__":
-    tester = FrontendUITester()
+    # --no-batch runs the project/feedback/revision steps as separate requests
+    tester = FrontendUITester(use_batch="--no-batch" not in sys.argv)
     tester.run_all_tests()
@@ -1,22 +1,26 @@
 #!/usr/bin/env python3
 """
-Initialize database with tables
+Initialize database by applying Alembic migrations
 """
 import sys
-sys.path.insert(0, 'backend')
+from pathlib import Path
 
-from app.db.session import engine, Base
-from app.models import User, Project, Feedback, Revision, ActionItem, Notification
+from alembic import command
+from alembic.config import Config
+
+BACKEND_DIR = Path(__file__).resolve().parent / "backend"
 
 def init_db():
-    """Create all database tables"""
-    print("Creating database tables...")
+    """Upgrade the database schema to the latest migration"""
+    print("Applying database migrations...")
     try:
-        Base.metadata.create_all(bind=engine)
-        print("✓ Database tables created successfully")
+        cfg = Config(str(BACKEND_DIR / "alembic.ini"))
+        cfg.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+        command.upgrade(cfg, "head")
+        print("✓ Database schema is up to date")
         return True
     except Exception as e:
-        print(f"✗ Error creating tables: {e}")
+        print(f"✗ Error applying migrations: {e}")
         return False
 
 if __name__ == "__main__":
@@ -7,6 +7,9 @@ import json
 
 BASE_URL = "http://localhost:8000"
 
+# Reuse one pooled connection across requests
+session = requests.Session()
+
 print("Testing authentication endpoints with detailed error info...\n")
 
 # Test registration
@@ -18,7 +21,7 @@ register_data = {
 }
 
 try:
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/api/v1/auth/register",
         json=register_data,
         timeout=10
@@ -38,7 +41,7 @@ login_data = {
 }
 
 try:
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/api/v1/auth/login",
         json=login_data,
         timeout=10
@@ -4,43 +4,234 @@ Deployment Readiness Test Script
 Tests all critical components before deployment
 """
 
+import asyncio
+import copy
+import io
 import os
+import re
 import sys
 import json
+import mmap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
-# Color codes for output
-GREEN = '\033[92m'
-RED = '\033[91m'
-YELLOW = '\033[93m'
-BLUE = '\033[94m'
-RESET = '\033[0m'
+try:
+    # C-level parser from the backend requirements; stdlib json if it isn't installed
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Top-level directories scanned for required files, and directories never descended into
+SCAN_ROOTS = {"backend", "frontend", "infra", ".github"}
+SKIP_DIRS = {"node_modules", "venv", ".venv", "__pycache__", "dist"}
+
+def _token_pattern(tokens, flags=0):
+    """Compile an alternation that finds any of the (str or bytes) tokens in one pass, longest first"""
+    separator = b"|" if isinstance(tokens[0], bytes) else "|"
+    return re.compile(separator.join(map(re.escape, sorted(tokens, key=len, reverse=True))), flags)
+
+# Bytes pattern: config.py is scanned through mmap without decoding
+CONFIG_PATTERN = _token_pattern([b"BLACKBOX_API_KEY", b"https://api.blackbox.ai/v1", b"blackboxai-pro"])
+AI_SERVICE_PATTERN = _token_pattern(["BLACKBOX_API_KEY", "base_url", "blackbox.ai"])
+DOCKER_SERVICES = ["postgres", "redis", "backend", "frontend", "celery-worker"]
+DOCKER_SERVICE_PATTERN = _token_pattern([f"{service}:" for service in DOCKER_SERVICES])
+BACKEND_PACKAGES = ["fastapi", "sqlalchemy", "alembic", "pydantic", "openai", "celery", "redis"]
+# Distribution name at the start of a requirements line, before extras/specifiers/markers
+REQUIREMENT_NAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+
+# Files whose contents the checks inspect, scanned up front in one batch
+CONFIG_FILE = "backend/app/core/config.py"
+AI_SERVICE_FILE = "backend/app/services/ai_service.py"
+COMPOSE_FILE = "docker-compose.yml"
+REQUIREMENTS_FILE = "backend/requirements.txt"
+PACKAGE_JSON_FILE = "frontend/package.json"
+
+# Tokens found in each content file, persisted between runs and keyed by (mtime, size)
+CACHE_FILE = ".deployment_cache.json"
+CACHE_SCHEMA_VERSION = 1  # Bump whenever the token patterns or extractors change
+
+# Color codes for output (disabled when stdout isn't a terminal, e.g. CI logs)
+if sys.stdout.isatty():
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    YELLOW = '\033[93m'
+    BLUE = '\033[94m'
+    RESET = '\033[0m'
+else:
+    GREEN = RED = YELLOW = BLUE = RESET = ''
+
+# Line prefixes/suffix built once instead of formatted on every call
+_SUCCESS_PREFIX = f"{GREEN}✓ "
+_ERROR_PREFIX = f"{RED}✗ "
+_WARNING_PREFIX = f"{YELLOW}⚠ "
+_INFO_PREFIX = f"{BLUE}ℹ "
+_LINE_END = f"{RESET}\n"
+_SEPARATOR_LINE = f"{BLUE}{'=' * 60}{RESET}\n"
+
+@lru_cache(maxsize=None)
+def _cached_stat(path_str):
+    """stat() a path once per run; None if it does not exist"""
+    try:
+        return os.stat(path_str)
+    except OSError:
+        return None
+
+def _entry_names(dir_str):
+    """Names in a directory from a single readdir; None if it does not exist"""
+    try:
+        with os.scandir(dir_str) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return None
+
+def _read_text(path_str):
+    with open(path_str) as f:
+        return f.read()
+
+def _mapped_tokens(path_str, pattern):
+    """Find bytes-pattern tokens through a read-only mmap, without copying or decoding the file"""
+    with open(path_str, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return set()  # Empty files can't be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return {token.decode() for token in pattern.findall(mm)}
+
+def _requirement_names(path_str):
+    """Lowercased distribution names listed in a requirements file"""
+    names = set()
+    for line in _read_text(path_str).splitlines():
+        match = REQUIREMENT_NAME.match(line.strip())
+        if match:
+            names.add(match.group().lower())
+    return names
+
+def _package_dependencies(path_str):
+    """Runtime dependency names declared in package.json"""
+    return set(json_loads(_read_text(path_str)).get("dependencies", {}))
+
+# Token extractor for each content file, given its absolute path
+EXTRACTORS = {
+    CONFIG_FILE: lambda path_str: _mapped_tokens(path_str, CONFIG_PATTERN),
+    AI_SERVICE_FILE: lambda path_str: set(AI_SERVICE_PATTERN.findall(_read_text(path_str))),
+    COMPOSE_FILE: lambda path_str: set(DOCKER_SERVICE_PATTERN.findall(_read_text(path_str))),
+    REQUIREMENTS_FILE: _requirement_names,
+    PACKAGE_JSON_FILE: _package_dependencies,
+}
+
+# Per-thread output buffer, so checks running in parallel don't interleave
+_output = threading.local()
+
+def _out():
+    return getattr(_output, "buffer", None) or sys.stdout
 
 def print_header(text):
-    print(f"\n{BLUE}{'='*60}{RESET}")
-    print(f"{BLUE}{text:^60}{RESET}")
-    print(f"{BLUE}{'='*60}{RESET}\n")
+    _out().write(f"\n{_SEPARATOR_LINE}{BLUE}{text:^60}{RESET}\n{_SEPARATOR_LINE}\n")
 
 def print_success(text):
-    print(f"{GREEN}✓ {text}{RESET}")
+    _out().write(_SUCCESS_PREFIX + text + _LINE_END)
 
 def print_error(text):
-    print(f"{RED}✗ {text}{RESET}")
+    _out().write(_ERROR_PREFIX + text + _LINE_END)
 
 def print_warning(text):
-    print(f"{YELLOW}⚠ {text}{RESET}")
+    _out().write(_WARNING_PREFIX + text + _LINE_END)
 
 def print_info(text):
-    print(f"{BLUE}ℹ {text}{RESET}")
+    _out().write(_INFO_PREFIX + text + _LINE_END)
 
 class DeploymentTester:
-    def __init__(self):
+    def __init__(self) -> None:
         self.root_dir = Path(__file__).parent
-        self.errors = []
-        self.warnings = []
-        self.passed = []
+        # Plain string root for os.path calls in the check loops
+        self.root_str = str(self.root_dir.resolve())
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.passed_count = 0
+        self._size_cache: Dict[str, int] = {}
+        self._file_keys: Dict[str, List[int]] = {}
+        self._failures: Dict[str, Exception] = {}
+        self._cache: Dict[str, Dict[str, Any]] = self._load_cache()
+        self._path_cache = self._scan_paths()
 
-    def test_file_structure(self):
+    def _scan_paths(self) -> Set[str]:
+        """
+        Collect file and directory paths under the project root in one walk
+        Sizes of top-level files (where the docs live) go into self._size_cache
+        """
+        paths = set()
+        pending = [("", self.root_str)]
+        while pending:
+            prefix, directory = pending.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    rel_path = prefix + entry.name
+                    paths.add(rel_path)
+                    if not prefix and entry.is_file(follow_symlinks=False):
+                        self._size_cache[rel_path] = entry.stat(follow_symlinks=False).st_size
+                    descend = entry.name not in SKIP_DIRS if prefix else entry.name in SCAN_ROOTS
+                    if descend and entry.is_dir(follow_symlinks=False):
+                        pending.append((rel_path + "/", entry.path))
+        return paths
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load cached tokens from the last run, discarding them on a schema change"""
+        try:
+            with open(os.path.join(self.root_str, CACHE_FILE)) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != CACHE_SCHEMA_VERSION:
+            return {}
+        return data.get("files", {})
+
+    def _save_cache(self) -> None:
+        """Persist cached tokens for the next run (best effort)"""
+        try:
+            with open(os.path.join(self.root_str, CACHE_FILE), "w") as f:
+                json.dump({"version": CACHE_SCHEMA_VERSION, "files": self._cache}, f)
+        except OSError:
+            pass
+
+    async def _load_all(self) -> None:
+        """
+        Extract tokens from content files concurrently into the cache
+        Missing files are skipped, and unchanged files with cached tokens are not read at all
+        """
+        paths: List[str] = []
+        for path in EXTRACTORS:
+            if path not in self._path_cache:
+                continue
+            stat = _cached_stat(os.path.join(self.root_str, path))
+            key = [stat.st_mtime_ns, stat.st_size]
+            self._file_keys[path] = key
+            entry = self._cache.get(path)
+            if entry is None or entry["key"] != key:
+                paths.append(path)
+        
+        results = await asyncio.gather(*(
+            asyncio.to_thread(EXTRACTORS[path], os.path.join(self.root_str, path)) for path in paths
+        ), return_exceptions=True)
+        for path, result in zip(paths, results):
+            if isinstance(result, Exception):
+                self._failures[path] = result
+            else:
+                self._cache[path] = {"key": self._file_keys[path], "tokens": sorted(result)}
+
+    def _tokens(self, path: str) -> Optional[Set[str]]:
+        """
+        Tokens extracted from a content file, or None if it is missing
+        Re-raises the error if extraction failed (e.g. invalid JSON)
+        """
+        if path not in self._file_keys:
+            return None
+        if path in self._failures:
+            raise self._failures[path]
+        return set(self._cache[path]["tokens"])
+
+    def test_file_structure(self) -> None:
         """Test that all required files exist"""
         print_header("Testing File Structure")
         
@@ -80,40 +271,38 @@ class DeploymentTester:
         ]
         
         for file_path in required_files:
-            full_path = self.root_dir / file_path
-            if full_path.exists():
+            if file_path in self._path_cache:
                 print_success(f"Found: {file_path}")
-                self.passed.append(f"File exists: {file_path}")
+                self.passed_count += 1
             else:
                 print_error(f"Missing: {file_path}")
                 self.errors.append(f"Missing file: {file_path}")
 
-    def test_backend_config(self):
+    def test_backend_config(self) -> None:
         """Test backend configuration"""
         print_header("Testing Backend Configuration")
         
         # Check if config.py has BLACKBOX_API_KEY
-        config_path = self.root_dir / "backend/app/core/config.py"
-        if config_path.exists():
-            content = config_path.read_text()
+        found = self._tokens(CONFIG_FILE)
+        if found is not None:
             
-            if "BLACKBOX_API_KEY" in content:
+            if "BLACKBOX_API_KEY" in found:
                 print_success("BLACKBOX_API_KEY configured in settings")
-                self.passed.append("BLACKBOX_API_KEY in config")
+                self.passed_count += 1
             else:
                 print_error("BLACKBOX_API_KEY not found in config")
                 self.errors.append("BLACKBOX_API_KEY missing from config")
             
-            if "https://api.blackbox.ai/v1" in content:
+            if "https://api.blackbox.ai/v1" in found:
                 print_success("Blackbox API endpoint configured")
-                self.passed.append("Blackbox API endpoint set")
+                self.passed_count += 1
             else:
                 print_error("Blackbox API endpoint not configured")
                 self.errors.append("Blackbox API endpoint missing")
             
-            if "blackboxai-pro" in content:
+            if "blackboxai-pro" in found:
                 print_success("Blackbox AI model configured")
-                self.passed.append("Blackbox AI model set")
+                self.passed_count += 1
             else:
                 print_warning("Default model might not be blackboxai-pro")
                 self.warnings.append("Check model configuration")
@@ -121,24 +310,23 @@ class DeploymentTester:
             print_error("config.py not found")
             self.errors.append("config.py missing")
 
-    def test_ai_service(self):
+    def test_ai_service(self) -> None:
         """Test AI service configuration"""
         print_header("Testing AI Service")
         
-        ai_service_path = self.root_dir / "backend/app/services/ai_service.py"
-        if ai_service_path.exists():
-            content = ai_service_path.read_text()
+        found = self._tokens(AI_SERVICE_FILE)
+        if found is not None:
             
-            if "BLACKBOX_API_KEY" in content:
+            if "BLACKBOX_API_KEY" in found:
                 print_success("AI service uses BLACKBOX_API_KEY")
-                self.passed.append("AI service configured for Blackbox")
+                self.passed_count += 1
             else:
                 print_error("AI service not using BLACKBOX_API_KEY")
                 self.errors.append("AI service config incorrect")
             
-            if "base_url" in content and "blackbox.ai" in content:
+            if "base_url" in found and "blackbox.ai" in found:
                 print_success("AI service points to Blackbox endpoint")
-                self.passed.append("AI service endpoint correct")
+                self.passed_count += 1
             else:
                 print_error("AI service endpoint not configured")
                 self.errors.append("AI service endpoint missing")
@@ -146,20 +334,18 @@ class DeploymentTester:
             print_error("ai_service.py not found")
             self.errors.append("ai_service.py missing")
 
-    def test_docker_config(self):
+    def test_docker_config(self) -> None:
         """Test Docker configuration"""
         print_header("Testing Docker Configuration")
         
         # Check docker-compose.yml
-        compose_path = self.root_dir / "docker-compose.yml"
-        if compose_path.exists():
-            content = compose_path.read_text()
+        found = self._tokens(COMPOSE_FILE)
+        if found is not None:
             
-            services = ["postgres", "redis", "backend", "frontend", "celery-worker"]
-            for service in services:
-                if f"{service}:" in content:
+            for service in DOCKER_SERVICES:
+                if f"{service}:" in found:
                     print_success(f"Service defined: {service}")
-                    self.passed.append(f"Docker service: {service}")
+                    self.passed_count += 1
                 else:
                     print_warning(f"Service might be missing: {service}")
                     self.warnings.append(f"Check service: {service}")
@@ -168,45 +354,34 @@ class DeploymentTester:
             self.errors.append("docker-compose.yml missing")
         
         # Check Dockerfiles
-        backend_dockerfile = self.root_dir / "backend/Dockerfile"
-        frontend_dockerfile = self.root_dir / "frontend/Dockerfile"
+        backend_dockerfile = os.path.join(self.root_str, "backend/Dockerfile")
+        frontend_dockerfile = os.path.join(self.root_str, "frontend/Dockerfile")
         
-        if backend_dockerfile.exists():
+        if _cached_stat(backend_dockerfile) is not None:
             print_success("Backend Dockerfile exists")
-            self.passed.append("Backend Dockerfile present")
+            self.passed_count += 1
         else:
             print_error("Backend Dockerfile missing")
             self.errors.append("Backend Dockerfile missing")
         
-        if frontend_dockerfile.exists():
+        if _cached_stat(frontend_dockerfile) is not None:
             print_success("Frontend Dockerfile exists")
-            self.passed.append("Frontend Dockerfile present")
+            self.passed_count += 1
         else:
             print_error("Frontend Dockerfile missing")
             self.errors.append("Frontend Dockerfile missing")
 
-    def test_dependencies(self):
+    def test_dependencies(self) -> None:
         """Test dependency files"""
         print_header("Testing Dependencies")
         
         # Backend dependencies
-        req_path = self.root_dir / "backend/requirements.txt"
-        if req_path.exists():
-            content = req_path.read_text()
-            required_packages = [
-                "fastapi",
-                "sqlalchemy",
-                "alembic",
-                "pydantic",
-                "openai",
-                "celery",
-                "redis"
-            ]
-            
-            for package in required_packages:
-                if package in content.lower():
+        found = self._tokens(REQUIREMENTS_FILE)
+        if found is not None:
+            for package in BACKEND_PACKAGES:
+                if package in found:
                     print_success(f"Backend dependency: {package}")
-                    self.passed.append(f"Dependency: {package}")
+                    self.passed_count += 1
                 else:
                     print_warning(f"Might be missing: {package}")
                     self.warnings.append(f"Check dependency: {package}")
@@ -215,19 +390,15 @@ class DeploymentTester:
             self.errors.append("requirements.txt missing")
         
         # Frontend dependencies
-        package_path = self.root_dir / "frontend/package.json"
-        if package_path.exists():
+        if PACKAGE_JSON_FILE in self._file_keys:
             try:
-                with open(package_path) as f:
-                    package_data = json.load(f)
-                
-                deps = package_data.get("dependencies", {})
+                deps = self._tokens(PACKAGE_JSON_FILE)
                 required_deps = ["react", "react-dom", "react-router-dom", "axios"]
                 
                 for dep in required_deps:
                     if dep in deps:
                         print_success(f"Frontend dependency: {dep}")
-                        self.passed.append(f"Frontend dep: {dep}")
+                        self.passed_count += 1
                     else:
                         print_warning(f"Might be missing: {dep}")
                         self.warnings.append(f"Check frontend dep: {dep}")
@@ -238,7 +409,7 @@ class DeploymentTester:
             print_error("package.json not found")
             self.errors.append("package.json missing")
 
-    def test_documentation(self):
+    def test_documentation(self) -> None:
         """Test documentation completeness"""
         print_header("Testing Documentation")
         
@@ -250,12 +421,11 @@ class DeploymentTester:
         ]
         
         for doc in docs:
-            doc_path = self.root_dir / doc
-            if doc_path.exists():
-                size = doc_path.stat().st_size
+            size = self._size_cache.get(doc)
+            if size is not None:
                 if size > 1000:  # At least 1KB
                     print_success(f"Documentation: {doc} ({size} bytes)")
-                    self.passed.append(f"Doc complete: {doc}")
+                    self.passed_count += 1
                 else:
                     print_warning(f"Documentation might be incomplete: {doc}")
                     self.warnings.append(f"Check doc: {doc}")
@@ -263,12 +433,12 @@ class DeploymentTester:
                 print_error(f"Documentation missing: {doc}")
                 self.errors.append(f"Missing doc: {doc}")
 
-    def test_api_structure(self):
+    def test_api_structure(self) -> None:
         """Test API endpoint structure"""
         print_header("Testing API Structure")
         
-        endpoints_dir = self.root_dir / "backend/app/api/v1/endpoints"
-        if endpoints_dir.exists():
+        present = _entry_names(os.path.join(self.root_str, "backend/app/api/v1/endpoints"))
+        if present is not None:
             endpoint_files = [
                 "auth.py",
                 "projects.py",
@@ -279,10 +449,9 @@ class DeploymentTester:
             ]
             
             for endpoint in endpoint_files:
-                endpoint_path = endpoints_dir / endpoint
-                if endpoint_path.exists():
+                if endpoint in present:
                     print_success(f"Endpoint module: {endpoint}")
-                    self.passed.append(f"Endpoint: {endpoint}")
+                    self.passed_count += 1
                 else:
                     print_error(f"Endpoint missing: {endpoint}")
                     self.errors.append(f"Missing endpoint: {endpoint}")
@@ -290,12 +459,12 @@ class DeploymentTester:
             print_error("Endpoints directory not found")
             self.errors.append("Endpoints directory missing")
 
-    def test_database_models(self):
+    def test_database_models(self) -> None:
         """Test database models"""
         print_header("Testing Database Models")
         
-        models_dir = self.root_dir / "backend/app/models"
-        if models_dir.exists():
+        present = _entry_names(os.path.join(self.root_str, "backend/app/models"))
+        if present is not None:
             model_files = [
                 "user.py",
                 "project.py",
@@ -306,10 +475,9 @@ class DeploymentTester:
             ]
             
             for model in model_files:
-                model_path = models_dir / model
-                if model_path.exists():
+                if model in present:
                     print_success(f"Model: {model}")
-                    self.passed.append(f"Model: {model}")
+                    self.passed_count += 1
                 else:
                     print_error(f"Model missing: {model}")
                     self.errors.append(f"Missing model: {model}")
@@ -317,14 +485,25 @@ class DeploymentTester:
             print_error("Models directory not found")
             self.errors.append("Models directory missing")
 
-    def generate_report(self):
+    def _run_isolated(self, test: Callable[["DeploymentTester"], None]) -> Tuple["DeploymentTester", str]:
+        """Run one check on a copy of the tester with its own results and output buffer"""
+        shard = copy.copy(self)
+        shard.errors, shard.warnings, shard.passed_count = [], [], 0
+        _output.buffer = io.StringIO()
+        try:
+            test(shard)
+            return shard, _output.buffer.getvalue()
+        finally:
+            _output.buffer = None
+
+    def generate_report(self) -> bool:
         """Generate final report"""
         print_header("Deployment Readiness Report")
         
-        total_tests = len(self.passed) + len(self.errors) + len(self.warnings)
+        total_tests = self.passed_count + len(self.errors) + len(self.warnings)
         
         print(f"\n{BLUE}Summary:{RESET}")
-        print(f"  {GREEN}Passed: {len(self.passed)}{RESET}")
+        print(f"  {GREEN}Passed: {self.passed_count}{RESET}")
         print(f"  {RED}Errors: {len(self.errors)}{RESET}")
         print(f"  {YELLOW}Warnings: {len(self.warnings)}{RESET}")
         print(f"  Total Checks: {total_tests}")
@@ -341,7 +520,7 @@ class DeploymentTester:
         
         # Calculate readiness score
         if total_tests > 0:
-            score = (len(self.passed) / total_tests) * 100
+            score = (self.passed_count / total_tests) * 100
             print(f"\n{BLUE}Deployment Readiness Score: {score:.1f}%{RESET}")
             
             if score >= 90:
@@ -356,20 +535,37 @@ class DeploymentTester:
         
         return False
 
-    def run_all_tests(self):
+    def run_all_tests(self) -> int:
         """Run all deployment tests"""
         print_header("Freelancer Feedback Assistant - Deployment Test")
         print_info("Testing deployment readiness...")
         
-        self.test_file_structure()
-        self.test_backend_config()
-        self.test_ai_service()
-        self.test_docker_config()
-        self.test_dependencies()
-        self.test_documentation()
-        self.test_api_structure()
-        self.test_database_models()
+        # The stat cache is scoped to a single run; changed files are scanned once up front
+        _cached_stat.cache_clear()
+        asyncio.run(self._load_all())
+        
+        tests = [
+            DeploymentTester.test_file_structure,
+            DeploymentTester.test_backend_config,
+            DeploymentTester.test_ai_service,
+            DeploymentTester.test_docker_config,
+            DeploymentTester.test_dependencies,
+            DeploymentTester.test_documentation,
+            DeploymentTester.test_api_structure,
+            DeploymentTester.test_database_models,
+        ]
+        
+        # The checks are independent and I/O-bound: overlap them, then merge in order
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            results = list(executor.map(self._run_isolated, tests))
+        
+        for shard, output in results:
+            sys.stdout.write(output)
+            self.errors.extend(shard.errors)
+            self.warnings.extend(shard.warnings)
+            self.passed_count += shard.passed_count
         
+        self._save_cache()
         ready = self.generate_report()
         
         return 0 if ready else 1
@@ -2,9 +2,13 @@
 """
 Test password hashing with the fix
 """
+import os
 import sys
 sys.path.insert(0, 'backend')
 
+# Minimum bcrypt cost: this only checks hash/verify round-trips, not hash strength
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 from app.core.security import get_password_hash, verify_password
 
 # Test password
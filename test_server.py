@@ -6,6 +6,24 @@ import subprocess
 import time
 import requests
 import sys
+from requests.adapters import HTTPAdapter
+
+HEALTH_URL = "http://localhost:8000/health"
+# Backoff between readiness probes (~3s in total, like the old fixed sleep)
+STARTUP_POLL_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8, 1.6)
+
+def wait_for_server(session, process):
+    """Poll the health endpoint until it answers, the server exits, or the delays run out"""
+    for delay in STARTUP_POLL_DELAYS:
+        if process.poll() is not None:
+            return False
+        try:
+            if session.get(HEALTH_URL, timeout=0.5).status_code == 200:
+                return True
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(delay)
+    return False
 
 def test_server():
     print("=" * 60)
@@ -17,19 +35,23 @@ def test_server():
     process = subprocess.Popen(
         ["uvicorn", "app.main:app", "--host", "0.0.0.0", "--port", "8000"],
         cwd="backend",
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
+        # Output is never read; discarding it means a full pipe can't stall uvicorn
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
     )
     
+    # One kept-alive connection for every request to the server
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    
     # Wait for server to start
     print("   Waiting for server to start...")
-    time.sleep(3)
+    wait_for_server(session, process)
     
     try:
         # Test health endpoint
         print("\n2. Testing health endpoint...")
-        response = requests.get("http://localhost:8000/health", timeout=5)
+        response = session.get(HEALTH_URL, timeout=5)
         print(f"   Status: {response.status_code}")
         print(f"   Response: {response.json()}")
         
@@ -41,7 +63,7 @@ def test_server():
         
         # Test API docs
         print("\n3. Testing API documentation...")
-        response = requests.get("http://localhost:8000/docs", timeout=5)
+        response = session.get("http://localhost:8000/docs", timeout=5)
         print(f"   Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -52,7 +74,7 @@ def test_server():
         
         # Test OpenAPI schema
         print("\n4. Testing OpenAPI schema...")
-        response = requests.get("http://localhost:8000/openapi.json", timeout=5)
+        response = session.get("http://localhost:8000/openapi.json", timeout=5)
         print(f"   Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -90,6 +112,8 @@ def test_server():
         print(f"\n✗ Test failed: {e}")
         return False
     finally:
+        session.close()
+        
         # Stop server
         process.terminate()
         try:
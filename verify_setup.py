@@ -4,10 +4,13 @@ Verify Project Setup
 Checks that all critical files and dependencies are in place
 """
 
+import argparse
+import json
 import os
 import sys
-from pathlib import Path
-from typing import List, Tuple
+import threading
+from functools import lru_cache
+from itertools import chain
 
 class Colors:
     GREEN = '\033[92m'
@@ -16,149 +19,262 @@ class Colors:
     BLUE = '\033[94m'
     END = '\033[0m'
 
+# Status symbols colored once instead of on every line
+_OK = f"{Colors.GREEN}✓{Colors.END} "
+_FAIL = f"{Colors.RED}✗{Colors.END} "
+_RULE = f"{Colors.BLUE}{'=' * 60}{Colors.END}"
+
+# Critical Backend Files
+BACKEND_FILES = (
+    "backend/app/main.py",
+    "backend/app/core/config.py",
+    "backend/app/core/security.py",
+    "backend/app/db/session.py",
+    "backend/app/models/user.py",
+    "backend/app/models/project.py",
+    "backend/app/models/feedback.py",
+    "backend/app/api/v1/api.py",
+    "backend/app/api/v1/endpoints/auth.py",
+    "backend/app/services/ai_service.py",
+    "backend/requirements.txt",
+    "backend/Dockerfile",
+    "backend/alembic.ini",
+)
+
+# Critical Frontend Files
+FRONTEND_FILES = (
+    "frontend/package.json",
+    "frontend/vite.config.ts",
+    "frontend/tsconfig.json",
+    "frontend/src/main.tsx",
+    "frontend/src/App.tsx",
+    "frontend/src/contexts/AuthContext.tsx",
+    "frontend/src/services/api.ts",
+    "frontend/src/pages/Login.tsx",
+    "frontend/src/pages/Dashboard.tsx",
+    "frontend/Dockerfile",
+)
+
+# Configuration Files
+CONFIG_FILES = (
+    ".env.example",
+    ".gitignore",
+    "docker-compose.yml",
+    "Makefile",
+    "README.md",
+    "IMPLEMENTATION_PLAN.md",
+    "TODO.md",
+    "PROJECT_SUMMARY.md",
+)
+
+# Directory Structure
+DIRECTORIES = (
+    "backend/app/api/v1/endpoints",
+    "backend/app/core",
+    "backend/app/db",
+    "backend/app/models",
+    "backend/app/schemas",
+    "backend/app/services",
+    "backend/alembic",
+    "frontend/src/components",
+    "frontend/src/contexts",
+    "frontend/src/pages",
+    "frontend/src/services",
+    "infra/terraform",
+    "infra/docker",
+)
+
+# Record of the last passing run, reused while nothing the checks read has changed
+CACHE_FILE = ".verify_setup_cache.json"
+
+# Cached, so every check in the same directory is a dict lookup
+@lru_cache(maxsize=None)
+def _listing(parent: str) -> dict[str, os.DirEntry]:
+    """Entries of a directory by name from a single readdir (empty if it isn't a directory)"""
+    # One open+getdents, without a separate isdir() stat beforehand
+    try:
+        with os.scandir(parent or ".") as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
 def check_file_exists(filepath: str) -> bool:
     """Check if a file exists"""
-    return Path(filepath).exists()
+    parent, name = os.path.split(filepath)
+    return name in _listing(parent)
 
 def check_directory_exists(dirpath: str) -> bool:
     """Check if a directory exists"""
-    return Path(dirpath).is_dir()
+    parent, name = os.path.split(dirpath)
+    entry = _listing(parent).get(name)
+    # The entry type comes from readdir, so only a symlink costs a stat() here
+    return entry is not None and entry.is_dir()
+
+def find_existing(filepaths: tuple[str, ...], directories: tuple[str, ...]) -> frozenset[str]:
+    """The expected files and directories that exist, read with one listing per parent directory"""
+    # The listings are independent, so read them concurrently: on a cold cache each one
+    # waits on the disk. Plain threads, since concurrent.futures costs more to import
+    # (it pulls in logging) than a warm run spends listing
+    parents = {os.path.dirname(path) for path in filepaths + directories}
+    readers = [threading.Thread(target=_listing, args=(parent,)) for parent in parents]
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join()
+    return frozenset(chain(
+        (path for path in filepaths if check_file_exists(path)),
+        (path for path in directories if check_directory_exists(path))
+    ))
 
-def print_status(message: str, status: bool):
-    """Print colored status message"""
-    symbol = f"{Colors.GREEN}✓{Colors.END}" if status else f"{Colors.RED}✗{Colors.END}"
-    print(f"{symbol} {message}")
+def count_by_extension(root: str, extensions: tuple[str, ...]) -> dict[str, int]:
+    """Count files under root by extension in one scandir walk (symlinked directories aren't followed)"""
+    counts = {ext: 0 for ext in extensions}
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                for ext in extensions:
+                    if entry.name.endswith(ext):
+                        counts[ext] += 1
+                        break
+    return counts
+
+def status_line(message: str, status: bool) -> str:
+    """Colored status line, newline included"""
+    return (_OK if status else _FAIL) + message + "\n"
+
+def run_checks(title: str, items: tuple[str, ...], existing: frozenset[str]) -> bool:
+    """Write one section of results in a single write; True if every item exists"""
+    lines = [f"\n{Colors.YELLOW}{title}{Colors.END}\n"]
+    lines.extend(status_line(item, item in existing) for item in items)
+    sys.stdout.write("".join(lines))
+    return all(item in existing for item in items)
+
+def cache_record() -> dict | None:
+    """
+    The expected paths plus the mtime of every directory the checks list
+    Adding, removing or renaming an entry updates its directory's mtime, so an
+    equal record means every check would give the same answer. None if a
+    directory is missing
+    """
+    expected = BACKEND_FILES + FRONTEND_FILES + CONFIG_FILES + DIRECTORIES
+    mtimes = {}
+    for directory in sorted({os.path.dirname(path) for path in expected}):
+        try:
+            mtimes[directory] = os.stat(directory or ".").st_mtime_ns
+        except OSError:
+            return None
+    return {"expected": list(expected), "mtimes": mtimes}
+
+def load_cache() -> dict | None:
+    """Record saved by the last passing run, if any"""
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_cache(record: dict) -> None:
+    """Persist a passing run's record (best effort)"""
+    # Overwritten in place rather than renamed over: a rename would change the
+    # mtime of the repository root, which the record itself watches. A torn
+    # write just fails to parse next time and counts as a miss
+    try:
+        created = not os.path.exists(CACHE_FILE)
+        with open(CACHE_FILE, "w") as f:
+            json.dump(record, f)
+        if created:
+            # Creating the file changed the root's mtime; record the new one
+            record["mtimes"][""] = os.stat(".").st_mtime_ns
+            with open(CACHE_FILE, "w") as f:
+                json.dump(record, f)
+    except OSError:
+        pass
 
 def main():
     """Run all verification checks"""
-    print(f"\n{Colors.BLUE}{'='*60}{Colors.END}")
-    print(f"{Colors.BLUE}Freelancer Feedback Assistant - Setup Verification{Colors.END}")
-    print(f"{Colors.BLUE}{'='*60}{Colors.END}\n")
-    
-    all_checks_passed = True
-    
-    # Critical Backend Files
-    print(f"{Colors.YELLOW}Backend Files:{Colors.END}")
-    backend_files = [
-        "backend/app/main.py",
-        "backend/app/core/config.py",
-        "backend/app/core/security.py",
-        "backend/app/db/session.py",
-        "backend/app/models/user.py",
-        "backend/app/models/project.py",
-        "backend/app/models/feedback.py",
-        "backend/app/api/v1/api.py",
-        "backend/app/api/v1/endpoints/auth.py",
-        "backend/app/services/ai_service.py",
-        "backend/requirements.txt",
-        "backend/Dockerfile",
-        "backend/alembic.ini",
-    ]
-    
-    for file in backend_files:
-        exists = check_file_exists(file)
-        print_status(file, exists)
-        if not exists:
-            all_checks_passed = False
-    
-    # Critical Frontend Files
-    print(f"\n{Colors.YELLOW}Frontend Files:{Colors.END}")
-    frontend_files = [
-        "frontend/package.json",
-        "frontend/vite.config.ts",
-        "frontend/tsconfig.json",
-        "frontend/src/main.tsx",
-        "frontend/src/App.tsx",
-        "frontend/src/contexts/AuthContext.tsx",
-        "frontend/src/services/api.ts",
-        "frontend/src/pages/Login.tsx",
-        "frontend/src/pages/Dashboard.tsx",
-        "frontend/Dockerfile",
-    ]
+    parser = argparse.ArgumentParser(description="Verify the project setup")
+    parser.add_argument("--fail-fast", action="store_true",
+                        help="stop after the first section with a missing entry, skipping the statistics")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="run every check even if nothing has changed since the last passing run")
+    args = parser.parse_args()
     
-    for file in frontend_files:
-        exists = check_file_exists(file)
-        print_status(file, exists)
-        if not exists:
-            all_checks_passed = False
+    sys.stdout.write(f"\n{_RULE}\n{Colors.BLUE}Freelancer Feedback Assistant - Setup Verification{Colors.END}\n{_RULE}\n")
     
-    # Configuration Files
-    print(f"\n{Colors.YELLOW}Configuration Files:{Colors.END}")
-    config_files = [
-        ".env.example",
-        ".gitignore",
-        "docker-compose.yml",
-        "Makefile",
-        "README.md",
-        "IMPLEMENTATION_PLAN.md",
-        "TODO.md",
-        "PROJECT_SUMMARY.md",
-    ]
+    # Taken before the checks, so a change made while they run invalidates the saved record
+    record = cache_record()
+    if record is not None and not args.no_cache and load_cache() == record:
+        print(f"\n{Colors.GREEN}✓ All checks passed (nothing changed since the last passing run; "
+              f"use --no-cache for the full report){Colors.END}")
+        print(f"{_RULE}\n")
+        return
     
-    for file in config_files:
-        exists = check_file_exists(file)
-        print_status(file, exists)
-        if not exists:
-            all_checks_passed = False
+    # Do all the filesystem reads up front; the sections below only look results up
+    existing = find_existing(BACKEND_FILES + FRONTEND_FILES + CONFIG_FILES, DIRECTORIES)
     
-    # Directory Structure
-    print(f"\n{Colors.YELLOW}Directory Structure:{Colors.END}")
-    directories = [
-        "backend/app/api/v1/endpoints",
-        "backend/app/core",
-        "backend/app/db",
-        "backend/app/models",
-        "backend/app/schemas",
-        "backend/app/services",
-        "backend/alembic",
-        "frontend/src/components",
-        "frontend/src/contexts",
-        "frontend/src/pages",
-        "frontend/src/services",
-        "infra/terraform",
-        "infra/docker",
+    sections = [
+        ("Backend Files:", BACKEND_FILES),
+        ("Frontend Files:", FRONTEND_FILES),
+        ("Configuration Files:", CONFIG_FILES),
+        ("Directory Structure:", DIRECTORIES),
     ]
-    
-    for directory in directories:
-        exists = check_directory_exists(directory)
-        print_status(directory, exists)
-        if not exists:
+    all_checks_passed = True
+    for title, items in sections:
+        if not run_checks(title, items, existing):
             all_checks_passed = False
+            if args.fail_fast:
+                break
     
-    # Count files
-    print(f"\n{Colors.YELLOW}Statistics:{Colors.END}")
-    
-    backend_py_files = len(list(Path("backend").rglob("*.py")))
-    frontend_tsx_files = len(list(Path("frontend/src").rglob("*.tsx"))) if Path("frontend/src").exists() else 0
-    frontend_ts_files = len(list(Path("frontend/src").rglob("*.ts"))) if Path("frontend/src").exists() else 0
-    
-    print(f"  Backend Python files: {backend_py_files}")
-    print(f"  Frontend TypeScript files: {frontend_tsx_files + frontend_ts_files}")
-    print(f"  Total project files: {backend_py_files + frontend_tsx_files + frontend_ts_files}")
+    # Count files (a tree walk, so not worth it once --fail-fast has its answer)
+    if all_checks_passed or not args.fail_fast:
+        backend_py_files = count_by_extension("backend", (".py",))[".py"]
+        frontend_ts_files = sum(count_by_extension("frontend/src", (".tsx", ".ts")).values())
+        
+        sys.stdout.write(
+            f"\n{Colors.YELLOW}Statistics:{Colors.END}\n"
+            f"  Backend Python files: {backend_py_files}\n"
+            f"  Frontend TypeScript files: {frontend_ts_files}\n"
+            f"  Total project files: {backend_py_files + frontend_ts_files}\n"
+        )
     
     # Final Summary
-    print(f"\n{Colors.BLUE}{'='*60}{Colors.END}")
+    print(f"\n{_RULE}")
     if all_checks_passed:
-        print(f"{Colors.GREEN}✓ All checks passed! Project setup is complete.{Colors.END}")
-        print(f"\n{Colors.YELLOW}Next Steps:{Colors.END}")
-        print("1. Set up environment variables:")
-        print("   cp .env.example .env")
-        print("   cp backend/.env.example backend/.env")
-        print("   cp frontend/.env.example frontend/.env")
-        print("\n2. Start with Docker:")
-        print("   docker-compose up -d")
-        print("\n3. Or use Makefile:")
-        print("   make setup")
-        print("   make dev")
-        print("\n4. Access the application:")
-        print("   Frontend: http://localhost:3000")
-        print("   Backend: http://localhost:8000")
-        print("   API Docs: http://localhost:8000/docs")
+        sys.stdout.write(f"""{Colors.GREEN}✓ All checks passed! Project setup is complete.{Colors.END}
+
+{Colors.YELLOW}Next Steps:{Colors.END}
+1. Set up environment variables:
+   cp .env.example .env
+   cp backend/.env.example backend/.env
+   cp frontend/.env.example frontend/.env
+
+2. Start with Docker:
+   docker-compose up -d
+
+3. Or use Makefile:
+   make setup
+   make dev
+
+4. Access the application:
+   Frontend: http://localhost:3000
+   Backend: http://localhost:8000
+   API Docs: http://localhost:8000/docs
+""")
+        if record is not None:
+            save_cache(record)
     else:
         print(f"{Colors.RED}✗ Some checks failed. Please review the output above.{Colors.END}")
         sys.exit(1)
     
-    print(f"{Colors.BLUE}{'='*60}{Colors.END}\n")
+    print(f"{_RULE}\n")
 
 if __name__ == "__main__":
     main()